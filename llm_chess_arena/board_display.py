@@ -4,6 +4,9 @@ This module provides functions to display chess boards in the terminal using
 Unicode chess pieces and colored backgrounds for an appealing visual experience.
 """
 
+import os
+import sys
+
 import chess
 from typing import Optional, Dict
 
@@ -64,7 +67,8 @@ def get_piece_display(piece: Optional[chess.Piece]) -> str:
     """
     if piece is None:
         return " "
-    return PIECE_SYMBOLS.get(piece.symbol(), piece.symbol())
+    # PIECE_SYMBOLS covers all 12 pieces, so no fallback lookup is needed
+    return PIECE_SYMBOLS[piece.symbol()]
 
 
 def get_square_color(square: int) -> str:
@@ -96,98 +100,292 @@ def get_piece_color(piece: Optional[chess.Piece]) -> str:
     return Colors.WHITE if piece.color == chess.WHITE else Colors.BLACK
 
 
-def display_board(
+# Sliced for padding instead of formatting a fresh run of spaces per line
+_SPACES = " " * 64
+
+
+def _visible_len(text: str) -> int:
+    """Count the printable characters in a string, skipping ANSI SGR codes.
+
+    Args:
+        text: String possibly containing escape sequences like '\\033[1m'.
+
+    Returns:
+        Length of the text as it appears on the terminal.
+    """
+    visible_length = 0
+    index = 0
+    text_length = len(text)
+    while index < text_length:
+        if text[index] == "\033":
+            end = text.find("m", index)
+            index = text_length if end < 0 else end + 1
+        else:
+            visible_length += 1
+            index += 1
+    return visible_length
+
+
+def _build_piece_cell_lut() -> Dict[str, str]:
+    """Precompute the colored glyph cell for each of the 12 pieces.
+
+    Returns:
+        Mapping from piece symbol (e.g. 'N', 'p') to its text color and
+        padded glyph, ready to be placed after a square background color.
+    """
+    piece_cells = {}
+    for symbol in PIECE_SYMBOLS:
+        piece = chess.Piece.from_symbol(symbol)
+        piece_cells[symbol] = (
+            f"{get_piece_color(piece)} {get_piece_display(piece)} {Colors.RESET}"
+        )
+    return piece_cells
+
+
+# Rendered once at import so the board loop is a table lookup per square
+PIECE_CELLS: Dict[str, str] = _build_piece_cell_lut()
+EMPTY_CELL = f"{get_piece_color(None)} {get_piece_display(None)} {Colors.RESET}"
+
+
+def _build_file_header(files: str) -> str:
+    """Render the colored file labels shown above and below the board.
+
+    Args:
+        files: File letters in display order.
+
+    Returns:
+        The header line, indented to line up with the board squares.
+    """
+    return f"{'':>6}" + "".join(
+        f"{Colors.BOLD}{Colors.YELLOW}{file_char:>3}{Colors.RESET}"
+        for file_char in files
+    )
+
+
+# Board labels never change, so they are formatted once at import
+BOARD_TITLE_LINE = f"{'':>8}{Colors.BOLD}{Colors.CYAN}♛ Chess Board ♛{Colors.RESET}"
+FILE_HEADERS: Dict[bool, str] = {
+    False: _build_file_header("abcdefgh"),
+    True: _build_file_header("hgfedcba"),
+}
+RANK_LABELS = [
+    f"{Colors.BOLD}{Colors.YELLOW}{rank + 1:>4} {Colors.RESET}" for rank in range(8)
+]
+RANK_TRAILERS = [
+    f" {Colors.BOLD}{Colors.YELLOW}{rank + 1}{Colors.RESET}" for rank in range(8)
+]
+
+
+# Rendered rank rows keyed by the rank's contents, so redraws after a move
+# only rebuild the one or two ranks the move touched
+RANK_ROW_CACHE_MAX_SIZE = 1024
+_RANK_ROW_CACHE: Dict[tuple, str] = {}
+
+
+def _rank_row_key(
+    board: chess.Board, rank: int, flip: bool, marked_squares: Dict[int, str]
+) -> tuple:
+    """Build a cache key describing everything that affects a rank's row.
+
+    Args:
+        board: Chess board being displayed.
+        rank: Rank index (0-7).
+        flip: Whether the board is displayed from black's perspective.
+        marked_squares: Background overrides for highlighted squares.
+
+    Returns:
+        Hashable key of the rank's piece bitboards and highlights.
+    """
+    rank_mask = chess.BB_RANKS[rank]
+    return (
+        rank,
+        flip,
+        board.pawns & rank_mask,
+        board.knights & rank_mask,
+        board.bishops & rank_mask,
+        board.rooks & rank_mask,
+        board.queens & rank_mask,
+        board.kings & rank_mask,
+        board.occupied_co[chess.WHITE] & rank_mask,
+        tuple(
+            (square, bg_color)
+            for square, bg_color in marked_squares.items()
+            if chess.square_rank(square) == rank
+        ),
+    )
+
+
+def _render_rank_row(
+    board: chess.Board, rank: int, flip: bool, marked_squares: Dict[int, str]
+) -> str:
+    """Render the eight squares of one rank.
+
+    Args:
+        board: Chess board being displayed.
+        rank: Rank index (0-7).
+        flip: Whether the board is displayed from black's perspective.
+        marked_squares: Background overrides for highlighted squares.
+
+    Returns:
+        The colored row, without rank labels.
+    """
+    # Collected in a list and joined once to avoid building an intermediate
+    # string per square
+    row_parts = []
+    files_range = range(7, -1, -1) if flip else range(8)
+    # One bitboard scan over the rank instead of a piece_at() probe per square
+    rank_pieces = board.piece_map(mask=chess.BB_RANKS[rank])
+
+    for file in files_range:
+        square = chess.square(file, rank)
+        piece = rank_pieces.get(square)
+
+        # Determine background color (same rule as get_square_color, using
+        # the file/rank already in scope), unless the square is highlighted
+        bg_color = marked_squares.get(square) or (
+            Colors.BG_LIGHT_BROWN if (file + rank) % 2 == 1 else Colors.BG_DARK_BROWN
+        )
+
+        # Create the square display from the precomputed piece cell
+        row_parts.append(bg_color)
+        row_parts.append(EMPTY_CELL if piece is None else PIECE_CELLS[piece.symbol()])
+    return "".join(row_parts)
+
+
+def _format_board_lines(
     board: chess.Board,
     highlight_squares: Optional[list[int]] = None,
     last_move: Optional[chess.Move] = None,
     flip: bool = False,
-) -> None:
-    """Display a beautiful chess board in the terminal.
+) -> list[str]:
+    """Render the board display as terminal lines.
 
     Args:
         board: Chess board to display.
         highlight_squares: List of square indices to highlight.
         last_move: Last move to highlight (from and to squares).
         flip: Whether to display from black's perspective.
-    """
-    print()  # Empty line before board
 
-    # Board title
-    title = f"{Colors.BOLD}{Colors.CYAN}♛ Chess Board ♛{Colors.RESET}"
-    print(f"{'':>8}{title}")
-    print()
+    Returns:
+        Lines to print, including the blank lines around the board.
+    """
+    # Empty line, title, empty line
+    lines = ["", BOARD_TITLE_LINE, ""]
 
     # File labels (a-h)
-    files = "abcdefgh"
-    if flip:
-        files = files[::-1]
+    file_header = FILE_HEADERS[flip]
+    lines.append(file_header)
 
-    file_header = f"{'':>6}"
-    for file_char in files:
-        file_header += f"{Colors.BOLD}{Colors.YELLOW}{file_char:>3}{Colors.RESET}"
-    print(file_header)
+    # Square backgrounds overridden by highlights; highlights win over the
+    # last move, matching their display priority
+    marked_squares: Dict[int, str] = {}
+    if last_move:
+        marked_squares[last_move.from_square] = Colors.BG_RED
+        marked_squares[last_move.to_square] = Colors.BG_RED
+    for square in highlight_squares or ():
+        marked_squares[square] = Colors.BG_GREEN
 
     # Board rows
     ranks = range(8) if flip else range(7, -1, -1)
 
     for rank in ranks:
-        # Rank number
-        rank_display = f"{Colors.BOLD}{Colors.YELLOW}{rank + 1:>4} {Colors.RESET}"
+        row_key = _rank_row_key(board, rank, flip, marked_squares)
+        row = _RANK_ROW_CACHE.get(row_key)
+        if row is None:
+            row = _render_rank_row(board, rank, flip, marked_squares)
+            if len(_RANK_ROW_CACHE) >= RANK_ROW_CACHE_MAX_SIZE:
+                _RANK_ROW_CACHE.clear()
+            _RANK_ROW_CACHE[row_key] = row
 
-        # Board row
-        row = ""
-        files_range = range(7, -1, -1) if flip else range(8)
+        # Rank number + row + rank number
+        lines.append(RANK_LABELS[rank] + row + RANK_TRAILERS[rank])
 
-        for file in files_range:
-            square = chess.square(file, rank)
-            piece = board.piece_at(square)
+    # File labels (bottom)
+    lines.append(file_header)
+    lines.append("")  # Empty line after board
+    return lines
 
-            # Determine background color
-            bg_color = get_square_color(square)
 
-            # Check for highlights
-            if highlight_squares and square in highlight_squares:
-                bg_color = Colors.BG_GREEN
-            elif last_move and square in (last_move.from_square, last_move.to_square):
-                bg_color = Colors.BG_RED
+def _write_lines(lines: list[str]) -> None:
+    """Write lines to stdout in a single call.
 
-            # Piece symbol and color
-            piece_symbol = get_piece_display(piece)
-            piece_color = get_piece_color(piece)
+    One write lets a line-buffered terminal flush the whole frame at once
+    instead of once per line, which matters over slow links such as SSH.
+    The frame is encoded once and handed to the binary buffer directly,
+    skipping the text layer's per-write newline scanning. Streams without
+    a binary buffer (e.g. StringIO captures) get a plain text write, as does
+    Windows, where the text layer must translate newlines to CRLF.
 
-            # Create the square display
-            square_display = f"{bg_color}{piece_color} {piece_symbol} {Colors.RESET}"
-            row += square_display
+    Args:
+        lines: Lines to write, without trailing newlines.
+    """
+    frame = "\n".join(lines) + "\n"
+    stream = sys.stdout
+    binary_buffer = getattr(stream, "buffer", None)
+    if binary_buffer is None or os.name == "nt":
+        stream.write(frame)
+        return
 
-        # Print rank number + row + rank number
-        print(
-            f"{rank_display}{row} {Colors.BOLD}{Colors.YELLOW}{rank + 1}{Colors.RESET}"
-        )
+    # Earlier text writes must reach the buffer before this frame does
+    stream.flush()
+    binary_buffer.write(
+        frame.encode(stream.encoding or "utf-8", stream.errors or "strict")
+    )
+    binary_buffer.flush()
 
-    # File labels (bottom)
-    print(file_header)
-    print()  # Empty line after board
 
+def display_board(
+    board: chess.Board,
+    highlight_squares: Optional[list[int]] = None,
+    last_move: Optional[chess.Move] = None,
+    flip: bool = False,
+) -> None:
+    """Display a beautiful chess board in the terminal.
 
-def display_game_info(
+    Args:
+        board: Chess board to display.
+        highlight_squares: List of square indices to highlight.
+        last_move: Last move to highlight (from and to squares).
+        flip: Whether to display from black's perspective.
+    """
+    _write_lines(_format_board_lines(board, highlight_squares, last_move, flip))
+
+
+# Every status the info panel can show, already colored
+STATUS_LINES: Dict[str, str] = {
+    status: f"{Colors.BOLD}{status_color}{status}{Colors.RESET}"
+    for status, status_color in (
+        ("White to move", Colors.GREEN),
+        ("Black to move", Colors.GREEN),
+        ("CHECK!", Colors.RED),
+        ("WHITE WINS!", Colors.MAGENTA),
+        ("BLACK WINS!", Colors.MAGENTA),
+        ("DRAW!", Colors.MAGENTA),
+        ("GAME OVER", Colors.MAGENTA),
+    )
+}
+
+
+def _format_game_info_lines(
     board: chess.Board,
     move_count: Optional[int] = None,
     current_player: Optional[str] = None,
     last_move_san: Optional[str] = None,
-) -> None:
-    """Display game information below the board.
+) -> list[str]:
+    """Render game information as centered terminal lines.
 
     Args:
         board: Current chess board.
         move_count: Current move number.
         current_player: Name of current player.
         last_move_san: Last move in SAN notation.
+
+    Returns:
+        Lines to print, including the trailing blank line.
     """
     # Game status
-    status_color = Colors.GREEN
     if board.is_check():
         status = "CHECK!"
-        status_color = Colors.RED
     elif board.is_game_over():
         outcome = board.outcome()
         if outcome:
@@ -199,14 +397,12 @@ def display_game_info(
                 status = "DRAW!"
         else:
             status = "GAME OVER"
-        status_color = Colors.MAGENTA
     else:
         turn_name = "White" if board.turn == chess.WHITE else "Black"
         status = f"{turn_name} to move"
 
     # Display info
-    info_lines = []
-    info_lines.append(f"{Colors.BOLD}{status_color}{status}{Colors.RESET}")
+    info_lines = [STATUS_LINES[status]]
 
     if move_count is not None:
         info_lines.append(f"{Colors.CYAN}Move: {move_count}{Colors.RESET}")
@@ -217,16 +413,34 @@ def display_game_info(
     if last_move_san:
         info_lines.append(f"{Colors.GREEN}Last move: {last_move_san}{Colors.RESET}")
 
-    # Print centered
+    # Center each line
+    centered_lines = []
     for line in info_lines:
-        # Remove ANSI codes for centering calculation
-        import re
+        # Ignore ANSI codes for centering calculation
+        padding = max(0, (30 - _visible_len(line)) // 2)
+        centered_lines.append(_SPACES[:padding] + line)
 
-        clean_line = re.sub(r"\033\[[0-9;]*m", "", line)
-        padding = max(0, (30 - len(clean_line)) // 2)
-        print(f"{'':>{padding}}{line}")
+    centered_lines.append("")  # Empty line
+    return centered_lines
 
-    print()  # Empty line
+
+def display_game_info(
+    board: chess.Board,
+    move_count: Optional[int] = None,
+    current_player: Optional[str] = None,
+    last_move_san: Optional[str] = None,
+) -> None:
+    """Display game information below the board.
+
+    Args:
+        board: Current chess board.
+        move_count: Current move number.
+        current_player: Name of current player.
+        last_move_san: Last move in SAN notation.
+    """
+    _write_lines(
+        _format_game_info_lines(board, move_count, current_player, last_move_san)
+    )
 
 
 def display_move_prompt(player_name: str, move_count: int) -> None:
@@ -241,10 +455,17 @@ def display_move_prompt(player_name: str, move_count: int) -> None:
 
 
 def clear_screen() -> None:
-    """Clear the terminal screen."""
-    import os
+    """Clear the terminal screen.
 
-    os.system("cls" if os.name == "nt" else "clear")
+    Writes ANSI escape codes (cursor home, clear screen, clear scrollback)
+    rather than spawning a `clear` subprocess on every redraw. Windows keeps
+    using `cls`, since legacy consoles don't interpret ANSI codes.
+    """
+    if os.name == "nt":
+        os.system("cls")
+        return
+    sys.stdout.write("\033[H\033[2J\033[3J")
+    sys.stdout.flush()
 
 
 def display_board_with_context(
@@ -269,13 +490,17 @@ def display_board_with_context(
     # Convert last move to SAN if available
     last_move_san = None
     if last_move:
-        # Create a board copy to get SAN
-        temp_board = board.copy()
+        # Create a board copy to get SAN; only the last move is needed to
+        # step back, so the rest of the move stack isn't copied
+        temp_board = board.copy(stack=1)
         temp_board.pop()  # Remove last move
         last_move_san = temp_board.san(last_move)
 
-    display_board(board, last_move=last_move)
-    display_game_info(board, move_count, current_player, last_move_san)
+    # Board and info go out in one write so the frame appears at once
+    _write_lines(
+        _format_board_lines(board, last_move=last_move)
+        + _format_game_info_lines(board, move_count, current_player, last_move_san)
+    )
 
 
 # Test function to display the starting position
@@ -1,5 +1,10 @@
 """LLM player module."""
 
+from llm_chess_arena.player.llm.llm_cache import (
+    BaseLLMCache,
+    InMemoryLLMCache,
+    RedisLLMCache,
+)
 from llm_chess_arena.player.llm.llm_connector import LLMConnector
 from llm_chess_arena.player.llm.llm_move_handler import (
     BaseLLMMoveHandler,
@@ -8,6 +13,9 @@ from llm_chess_arena.player.llm.llm_move_handler import (
 from llm_chess_arena.player.llm.llm_player import LLMPlayer
 
 __all__ = [
+    "BaseLLMCache",
+    "InMemoryLLMCache",
+    "RedisLLMCache",
     "LLMConnector",
     "BaseLLMMoveHandler",
     "GameArenaLLMMoveHandler",
@@ -0,0 +1,138 @@
+"""Response caches that LLMConnector consults before calling a provider."""
+
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+# Default number of responses an in-memory cache holds before it is cleared
+IN_MEMORY_CACHE_MAX_SIZE = 1024
+
+
+class BaseLLMCache(ABC):
+    """Abstract response cache keyed by prompt and model configuration.
+
+    The prompt and the model configuration (``llm_string``) are passed
+    separately, so backends may match prompts fuzzily (e.g. by embedding
+    similarity) while only ever reusing responses from the same model setup.
+    """
+
+    @abstractmethod
+    def lookup(self, prompt: str, llm_string: str) -> Optional[list[str]]:
+        """Return cached completions for a request, if any.
+
+        Args:
+            prompt: Serialized chat messages.
+            llm_string: Serialized model and sampling parameters.
+
+        Returns:
+            Completion strings in provider order, or None on a miss.
+        """
+
+    @abstractmethod
+    def update(self, prompt: str, llm_string: str, contents: list[str]) -> None:
+        """Store the completions returned for a request.
+
+        Args:
+            prompt: Serialized chat messages.
+            llm_string: Serialized model and sampling parameters.
+            contents: Completion strings in provider order.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every cached response."""
+
+
+class InMemoryLLMCache(BaseLLMCache):
+    """Exact-match cache held in a process-local dict."""
+
+    def __init__(self, max_size: int = IN_MEMORY_CACHE_MAX_SIZE) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_size: Entries held before the cache is cleared.
+        """
+        self.max_size = max_size
+        self._responses: dict[tuple[str, str], tuple[str, ...]] = {}
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[list[str]]:
+        """Return a copy of the cached completions, if any."""
+        contents = self._responses.get((prompt, llm_string))
+        return list(contents) if contents is not None else None
+
+    def update(self, prompt: str, llm_string: str, contents: list[str]) -> None:
+        """Store completions, clearing the cache first if it is full."""
+        if len(self._responses) >= self.max_size:
+            self._responses.clear()
+        self._responses[(prompt, llm_string)] = tuple(contents)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._responses.clear()
+
+
+class RedisLLMCache(BaseLLMCache):
+    """Exact-match cache stored in Redis, shared across processes and runs.
+
+    Requires the optional ``redis`` dependency
+    (``pip install llm_chess_arena[redis]``) unless a client is passed in.
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        ttl_seconds: Optional[int] = 24 * 60 * 60,
+        key_prefix: str = "llm_cache:",
+        client: Any = None,
+    ) -> None:
+        """Connect to Redis.
+
+        Args:
+            url: Redis connection URL, used when no client is given.
+            ttl_seconds: Expiry for stored responses; None keeps them forever.
+            key_prefix: Prefix for every key this cache writes.
+            client: Existing redis client to use instead of connecting to url.
+
+        Raises:
+            ImportError: No client was given and redis is not installed.
+        """
+        if client is None:
+            try:
+                import redis
+            except ImportError as e:
+                raise ImportError(
+                    "RedisLLMCache requires the redis package; install it with "
+                    "`pip install llm_chess_arena[redis]`"
+                ) from e
+            client = redis.from_url(url)
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+
+    def _key(self, prompt: str, llm_string: str) -> str:
+        """Hash a request into a fixed-length Redis key."""
+        digest = hashlib.blake2b(
+            f"{llm_string}\n{prompt}".encode(), digest_size=32
+        ).hexdigest()
+        return f"{self.key_prefix}{digest}"
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[list[str]]:
+        """Fetch and decode cached completions, if any."""
+        payload = self.client.get(self._key(prompt, llm_string))
+        return json.loads(payload) if payload is not None else None
+
+    def update(self, prompt: str, llm_string: str, contents: list[str]) -> None:
+        """Store completions as JSON, expiring after ttl_seconds if set."""
+        key = self._key(prompt, llm_string)
+        payload = json.dumps(contents)
+        if self.ttl_seconds is None:
+            self.client.set(key, payload)
+        else:
+            self.client.setex(key, self.ttl_seconds, payload)
+
+    def clear(self) -> None:
+        """Delete every key under this cache's prefix."""
+        keys = list(self.client.scan_iter(match=f"{self.key_prefix}*"))
+        if keys:
+            self.client.delete(*keys)
@@ -1,21 +1,183 @@
-from typing import Optional
+import asyncio
+import atexit
+import functools
+import json
+import re
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, NamedTuple, Optional
+import httpx
 from loguru import logger
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    stop_before_delay,
+    wait_exponential,
+    wait_random,
+)
 
 import litellm
 
+from llm_chess_arena.player.llm.llm_cache import BaseLLMCache, InMemoryLLMCache
+
 # Cross-provider robustness: silently ignore unsupported params when switching between
 # models (OpenAI, Anthropic, Gemini) rather than erroring. Research code needs flexibility.
 litellm.drop_params = True
 litellm.set_verbose = False
 
+# Jittered exponential backoff for transient provider errors: 1, 2, 4, 8s (+0-1s)
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 8.0
+BACKOFF_JITTER_SECONDS = 1.0
+
+# Pool shared by every connector; sized so many players hitting the same
+# provider host (e.g. api.openai.com) reuse warm TLS connections
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+# With early_stop, a stream is closed once the line holding the final answer
+# ("Final Answer: X" / "The final answer is X") is complete. The marker must
+# open its line (after any markdown), so reasoning that merely mentions a
+# "final answer:" mid-sentence does not cut the response short.
+FINAL_ANSWER_LINE_PATTERN = re.compile(
+    r"^\W*(?:final answer\W*:|(?:the |my )?final answer is)[^\n]*\n",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Anthropic only reuses a cached prompt prefix for blocks marked with
+# cache_control; OpenAI and Gemini cache repeated prefixes automatically
+PROMPT_CACHING_MODEL_PREFIXES = ("claude-", "anthropic/")
+
+# Request arguments left out of the cache's model configuration: messages are
+# the cached prompt, and the rest do not change what the model returns
+_UNCACHED_COMPLETION_KWARGS = frozenset({"messages", "timeout", "max_retries"})
+
+
+class _ProviderErrorRule(NamedTuple):
+    """How a LiteLLM exception is logged, wrapped, and classified."""
+
+    log_level: str
+    log_template: str
+    wrapped_exception: type[Exception]
+    message_template: str
+    is_retryable: bool
+
+
+# Matched in order with isinstance, so subclasses must come before their bases.
+# Templates may reference {error} and {timeout}.
+_PROVIDER_ERROR_RULES: dict[type[Exception], _ProviderErrorRule] = {
+    litellm.Timeout: _ProviderErrorRule(
+        "WARNING",
+        "Request timed out after {timeout}s: {error}",
+        TimeoutError,
+        "Request timed out after {timeout}s",
+        True,
+    ),
+    **dict.fromkeys(
+        (
+            litellm.RateLimitError,
+            litellm.ServiceUnavailableError,
+            litellm.InternalServerError,
+        ),
+        _ProviderErrorRule(
+            "WARNING",
+            "Transient API error (may retry at higher level): {error}",
+            ConnectionError,
+            "LLM API temporarily unavailable: {error}",
+            True,
+        ),
+    ),
+    **dict.fromkeys(
+        (
+            litellm.AuthenticationError,
+            litellm.InvalidRequestError,
+            litellm.BadRequestError,
+            litellm.ContentPolicyViolationError,
+        ),
+        _ProviderErrorRule(
+            "ERROR",
+            "Permanent API error (will not retry): {error}",
+            ConnectionError,
+            "LLM API request invalid: {error}",
+            False,
+        ),
+    ),
+    # Connection resets and DNS failures were retried by the provider SDKs
+    # before LiteLLM's own retries were disabled, so they are retried here
+    litellm.APIConnectionError: _ProviderErrorRule(
+        "WARNING",
+        "Connection to LLM API failed (may retry): {error}",
+        ConnectionError,
+        "LLM API connection failed: {error}",
+        True,
+    ),
+    litellm.APIError: _ProviderErrorRule(
+        "ERROR",
+        "API error occurred: {error}",
+        ConnectionError,
+        "LLM API call failed: {error}",
+        False,
+    ),
+}
+
+_UNEXPECTED_ERROR_RULE = _ProviderErrorRule(
+    "ERROR",
+    "Unexpected error during LLM API call: {error}",
+    ConnectionError,
+    "Unexpected error: {error}",
+    False,
+)
+
+
+def _classify_provider_error(error: Exception) -> _ProviderErrorRule:
+    """Find the handling rule for an exception raised by LiteLLM.
+
+    Args:
+        error: Exception raised during the completion call.
+
+    Returns:
+        First matching rule, or the catch-all rule for unknown exceptions.
+    """
+    for error_type, rule in _PROVIDER_ERROR_RULES.items():
+        if isinstance(error, error_type):
+            return rule
+    return _UNEXPECTED_ERROR_RULE
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """Check whether a LiteLLM exception is transient and worth retrying.
+
+    Args:
+        error: Exception raised during the completion call.
+
+    Returns:
+        True for timeouts, connection failures, rate limits and
+        provider-side outages.
+    """
+    return _classify_provider_error(error).is_retryable
+
 
 class LLMConnector:
     """Wrapper around LiteLLM for testing isolation and API stability.
 
     Provides a thin abstraction over LiteLLM to enable easy mocking in tests
     and protect against future LiteLLM API changes.
+
+    All instances share one HTTP client (registered as LiteLLM's client
+    session unless one is already set), so connectors for different players
+    and models reuse pooled connections instead of each opening their own.
+
+    Temperature-0 responses are looked up in a pluggable cache (in-memory
+    per connector by default), so a repeated deterministic prompt is answered
+    without another provider call.
     """
 
+    _shared_http_client: Optional[httpx.Client] = None
+    _shared_http_client_lock = threading.Lock()
+
     def __init__(
         self,
         model: str,
@@ -23,6 +185,9 @@ class LLMConnector:
         max_tokens: Optional[int] = None,
         timeout: float = 30.0,
         max_retries: int = 3,
+        cache: Optional[BaseLLMCache] = None,
+        early_stop: bool = False,
+        deadline: Optional[float] = None,
     ):
         """Initialize LLM connector.
 
@@ -32,12 +197,36 @@ class LLMConnector:
             max_tokens: Maximum tokens in response.
             timeout: Request timeout in seconds.
             max_retries: Retry attempts for transient errors.
+            cache: Response cache for temperature-0 requests. Defaults to a
+                new InMemoryLLMCache for this connector.
+            early_stop: Stream single-completion responses and stop reading
+                once the final answer line is complete, skipping the decode
+                time of any explanation after it. The text is cut after the
+                first final answer, so a later corrected answer is lost.
+            deadline: Total seconds one query may spend across every attempt
+                and backoff sleep. Each attempt's timeout is cut to the time
+                left, and no retry starts if its backoff would end past the
+                deadline. None bounds a query by timeout and max_retries only.
         """
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.timeout = timeout
         self.max_retries = max_retries
+        self._get_shared_http_client()
+        # Static per-connector kwargs built once instead of on every query.
+        # LiteLLM's own retries are disabled: it does not back off on rate
+        # limits, so transient errors are retried here instead.
+        self._base_completion_kwargs = {
+            "model": model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "timeout": timeout,
+            "max_retries": 0,
+        }
+        self.cache = cache if cache is not None else InMemoryLLMCache()
+        self.early_stop = early_stop
+        self.deadline = deadline
 
     def query(
         self,
@@ -59,55 +248,468 @@ class LLMConnector:
 
         Raises:
             TimeoutError: Request exceeded timeout.
-            ConnectionError: API call failed.
+            ConnectionError: API call failed or returned a malformed response.
+        """
+        completion_kwargs = self._build_completion_kwargs(
+            prompt, n, system_prompt, kwargs
+        )
+        cache_request = self._cache_request(completion_kwargs)
+        if cache_request is not None:
+            cached_contents = self.cache.lookup(*cache_request)
+            if cached_contents is not None:
+                logger.debug(f"{self.model} response served from cache")
+                return cached_contents
+
+        contents = self._complete(completion_kwargs)
+        if cache_request is not None:
+            self.cache.update(*cache_request, contents)
+        return contents
+
+    async def aquery(
+        self,
+        prompt: str,
+        n: int = 1,
+        system_prompt: Optional[str] = None,
+        **kwargs,
+    ) -> list[str]:
+        """Async counterpart of query() built on litellm.acompletion.
+
+        Waiting on the provider yields to the event loop, so callers can
+        gather queries to several models or games and pay roughly the
+        slowest round trip instead of the sum. Retries, backoff and error
+        wrapping match query().
+
+        Args:
+            prompt: User message to send.
+            n: Number of completions to request.
+            system_prompt: Optional system-level instructions.
+            **kwargs: Additional params passed to litellm.acompletion.
+
+        Returns:
+            List of completion strings in provider order.
+
+        Raises:
+            TimeoutError: Request exceeded timeout.
+            ConnectionError: API call failed or returned a malformed response.
+        """
+        completion_kwargs = self._build_completion_kwargs(
+            prompt, n, system_prompt, kwargs
+        )
+        cache_request = self._cache_request(completion_kwargs)
+        if cache_request is not None:
+            cached_contents = self.cache.lookup(*cache_request)
+            if cached_contents is not None:
+                logger.debug(f"{self.model} response served from cache")
+                return cached_contents
+
+        contents = await self._acomplete(completion_kwargs)
+        if cache_request is not None:
+            self.cache.update(*cache_request, contents)
+        return contents
+
+    def cache_clear(self) -> None:
+        """Drop every cached response."""
+        self.cache.clear()
+
+    def _build_completion_kwargs(
+        self,
+        prompt: str,
+        n: int,
+        system_prompt: Optional[str],
+        extra_kwargs: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Assemble the completion arguments for one query.
+
+        Args:
+            prompt: User message to send.
+            n: Number of completions to request.
+            system_prompt: Optional system-level instructions.
+            extra_kwargs: Caller overrides, applied last.
+
+        Returns:
+            Keyword arguments for litellm.completion or litellm.acompletion.
         """
         messages = []
         if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
+            messages.append(
+                {"role": "system", "content": self._system_content(system_prompt)}
+            )
         messages.append({"role": "user", "content": prompt})
         logger.debug(f"Querying to {self.model} with the messages: {messages}")
 
-        try:
-            completion_kwarg = {
-                "messages": messages,
-                "model": self.model,
-                "temperature": self.temperature,
-                "max_tokens": self.max_tokens,
-                "timeout": self.timeout,
-                "max_retries": self.max_retries,
-                "n": n,
-                **kwargs,
+        completion_kwargs = {
+            **self._base_completion_kwargs,
+            "messages": messages,
+            "n": n,
+            **extra_kwargs,
+        }
+        # Interleaved choices of n > 1 streams are not worth cutting short
+        if self.early_stop and n == 1:
+            completion_kwargs["stream"] = True
+        return completion_kwargs
+
+    def _system_content(self, system_prompt: str) -> str | list[dict[str, Any]]:
+        """Mark the system prompt as a cacheable prefix where the provider needs it.
+
+        Args:
+            system_prompt: System-level instructions.
+
+        Returns:
+            The prompt itself, or for Anthropic models a text block tagged
+            with an ephemeral cache_control so repeated turns skip prefill.
+        """
+        if not self.model.startswith(PROMPT_CACHING_MODEL_PREFIXES):
+            return system_prompt
+        return [
+            {
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
             }
-            response = litellm.completion(**completion_kwarg)
-            contents = [choice.message.content for choice in response.choices]
-            logger.debug(f"{self.model} response choices: {contents}")
-            return contents
+        ]
 
-        except litellm.Timeout as e:
-            logger.warning(f"Request timed out after {self.timeout}s: {e}")
-            raise TimeoutError(f"Request timed out after {self.timeout}s") from e
+    def _complete(self, completion_kwargs: dict[str, Any]) -> list[str]:
+        """Run one completion request and return its contents.
 
-        except (
-            litellm.RateLimitError,
-            litellm.ServiceUnavailableError,
-            litellm.InternalServerError,
-        ) as e:
-            logger.warning(f"Transient API error (may retry at higher level): {e}")
-            raise ConnectionError(f"LLM API temporarily unavailable: {e}") from e
+        Args:
+            completion_kwargs: Arguments for litellm.completion.
 
-        except (
-            litellm.AuthenticationError,
-            litellm.InvalidRequestError,
-            litellm.BadRequestError,
-            litellm.ContentPolicyViolationError,
-        ) as e:
-            logger.error(f"Permanent API error (will not retry): {e}")
-            raise ConnectionError(f"LLM API request invalid: {e}") from e
+        Returns:
+            Completion strings in provider order.
 
-        except (litellm.APIError, litellm.APIConnectionError) as e:
-            logger.error(f"API error occurred: {e}")
-            raise ConnectionError(f"LLM API call failed: {e}") from e
+        Raises:
+            TimeoutError: Request exceeded timeout.
+            ConnectionError: API call failed or returned a malformed response.
+        """
+        try:
+            response = self._completion_with_backoff(**completion_kwargs)
+            if completion_kwargs.get("stream"):
+                return [self._read_until_final_answer(response)]
+        except Exception as e:
+            raise self._wrap_provider_error(e) from e
+        return self._extract_contents(response)
 
+    async def _acomplete(self, completion_kwargs: dict[str, Any]) -> list[str]:
+        """Async counterpart of _complete() using litellm.acompletion."""
+        try:
+            response = await self._acompletion_with_backoff(**completion_kwargs)
+            if completion_kwargs.get("stream"):
+                return [await self._aread_until_final_answer(response)]
         except Exception as e:
-            logger.error(f"Unexpected error during LLM API call: {e}")
-            raise ConnectionError(f"Unexpected error: {e}") from e
+            raise self._wrap_provider_error(e) from e
+        return self._extract_contents(response)
+
+    def _read_until_final_answer(self, stream: Any) -> str:
+        """Accumulate streamed text until the final answer line is complete.
+
+        Args:
+            stream: LiteLLM stream of completion chunks.
+
+        Returns:
+            Text received up to the end of the final answer line, or the
+            whole response if it never gives one.
+        """
+        text = ""
+        try:
+            for chunk in stream:
+                text += chunk.choices[0].delta.content or ""
+                if FINAL_ANSWER_LINE_PATTERN.search(text):
+                    logger.debug(f"{self.model} stream stopped after final answer")
+                    break
+        finally:
+            self._close_stream(stream)
+        return text
+
+    async def _aread_until_final_answer(self, stream: Any) -> str:
+        """Async counterpart of _read_until_final_answer()."""
+        text = ""
+        try:
+            async for chunk in stream:
+                text += chunk.choices[0].delta.content or ""
+                if FINAL_ANSWER_LINE_PATTERN.search(text):
+                    logger.debug(f"{self.model} stream stopped after final answer")
+                    break
+        finally:
+            await stream.aclose()
+        return text
+
+    @staticmethod
+    def _close_stream(stream: Any) -> None:
+        """Release the HTTP response behind a stream that is no longer read."""
+        # LiteLLM's sync stream wrapper has no close(); the provider stream
+        # it wraps does
+        for candidate in (stream, getattr(stream, "completion_stream", None)):
+            close = getattr(candidate, "close", None)
+            if callable(close):
+                close()
+                return
+
+    @staticmethod
+    def _cache_request(
+        completion_kwargs: dict[str, Any],
+    ) -> Optional[tuple[str, str]]:
+        """Serialize a request for the response cache, if it may be cached.
+
+        Only temperature-0 requests are cached; sampled responses are meant
+        to differ between calls.
+
+        Args:
+            completion_kwargs: Arguments for the completion call.
+
+        Returns:
+            (prompt, llm_string) for the cache's lookup and update, or None
+            when the request must go to the provider.
+        """
+        if completion_kwargs.get("temperature") != 0:
+            return None
+        llm_params = {
+            name: value
+            for name, value in completion_kwargs.items()
+            if name not in _UNCACHED_COMPLETION_KWARGS
+        }
+        try:
+            return (
+                json.dumps(completion_kwargs["messages"], sort_keys=True),
+                json.dumps(llm_params, sort_keys=True),
+            )
+        except TypeError:  # Caller kwargs that do not serialize, e.g. clients
+            return None
+
+    def _wrap_provider_error(self, error: Exception) -> Exception:
+        """Log a LiteLLM error and convert it to a standard exception.
+
+        Args:
+            error: Exception raised once retries are exhausted.
+
+        Returns:
+            TimeoutError or ConnectionError for the caller to raise.
+        """
+        rule = _classify_provider_error(error)
+        logger.log(
+            rule.log_level,
+            rule.log_template.format(error=error, timeout=self.timeout),
+        )
+        return rule.wrapped_exception(
+            rule.message_template.format(error=error, timeout=self.timeout)
+        )
+
+    def _extract_contents(self, response: Any) -> list[str]:
+        """Pull the completion strings out of a LiteLLM response.
+
+        Args:
+            response: LiteLLM completion response.
+
+        Returns:
+            Message content of every choice, in provider order.
+
+        Raises:
+            ConnectionError: A choice has no message content.
+        """
+        # LiteLLM normalizes every provider to the OpenAI shape, so direct
+        # attribute access is safe; a malformed response fails once here
+        try:
+            contents = [choice.message.content for choice in response.choices]
+        except AttributeError as e:
+            logger.error(f"{self.model} response missing content message: {e}")
+            raise ConnectionError("LLM response missing content message") from e
+
+        logger.debug(f"{self.model} response choices: {contents}")
+        return contents
+
+    @classmethod
+    def _get_shared_http_client(cls) -> httpx.Client:
+        """Lazily create the process-wide HTTP client and hand it to LiteLLM.
+
+        A client session the caller already installed on LiteLLM is left in
+        place; the shared client is only registered when none is set.
+
+        Returns:
+            The shared httpx client.
+        """
+        with cls._shared_http_client_lock:
+            if cls._shared_http_client is None:
+                cls._shared_http_client = httpx.Client(limits=HTTP_POOL_LIMITS)
+                if litellm.client_session is None:
+                    litellm.client_session = cls._shared_http_client
+                # Shared across players, so only close it at process exit
+                atexit.register(cls._close_shared_http_client)
+            return cls._shared_http_client
+
+    @classmethod
+    def _close_shared_http_client(cls) -> None:
+        """Close the shared HTTP client, if one was created."""
+        with cls._shared_http_client_lock:
+            if cls._shared_http_client is not None:
+                cls._shared_http_client.close()
+                if litellm.client_session is cls._shared_http_client:
+                    litellm.client_session = None
+                cls._shared_http_client = None
+
+    def _completion_with_backoff(self, **completion_kwargs) -> Any:
+        """Call litellm.completion, retrying transient errors with backoff.
+
+        Args:
+            **completion_kwargs: Arguments forwarded to litellm.completion.
+
+        Returns:
+            The LiteLLM completion response.
+
+        Raises:
+            Exception: The last LiteLLM error once retries are exhausted, or
+                the first non-retryable error.
+        """
+        started_at = time.monotonic()
+
+        def attempt() -> Any:
+            return litellm.completion(
+                **self._within_deadline(completion_kwargs, started_at)
+            )
+
+        retrying = Retrying(**self._retry_policy())
+        return retrying(attempt)
+
+    async def _acompletion_with_backoff(self, **completion_kwargs) -> Any:
+        """Await litellm.acompletion, retrying transient errors with backoff.
+
+        Args:
+            **completion_kwargs: Arguments forwarded to litellm.acompletion.
+
+        Returns:
+            The LiteLLM completion response.
+
+        Raises:
+            Exception: The last LiteLLM error once retries are exhausted, or
+                the first non-retryable error.
+        """
+        started_at = time.monotonic()
+
+        async def attempt() -> Any:
+            return await litellm.acompletion(
+                **self._within_deadline(completion_kwargs, started_at)
+            )
+
+        # Backoff sleeps must not block the event loop the other queries share
+        retrying = AsyncRetrying(sleep=asyncio.sleep, **self._retry_policy())
+        return await retrying(attempt)
+
+    def _within_deadline(
+        self, completion_kwargs: dict[str, Any], started_at: float
+    ) -> dict[str, Any]:
+        """Cut an attempt's timeout to the time left before the deadline.
+
+        Args:
+            completion_kwargs: Arguments for one completion attempt.
+            started_at: time.monotonic() reading when the query started.
+
+        Returns:
+            completion_kwargs, with a shorter timeout if the deadline is nearer.
+        """
+        if self.deadline is None:
+            return completion_kwargs
+        remaining = self.deadline - (time.monotonic() - started_at)
+        timeout = completion_kwargs.get("timeout")
+        if timeout is not None and timeout <= remaining:
+            return completion_kwargs
+        return {**completion_kwargs, "timeout": remaining}
+
+    def _retry_policy(self) -> dict[str, Any]:
+        """Tenacity settings shared by the sync and async retry loops."""
+        stop = stop_after_attempt(self.max_retries + 1)
+        if self.deadline is not None:
+            stop |= stop_before_delay(self.deadline)
+        return {
+            "stop": stop,
+            "wait": wait_exponential(
+                multiplier=BACKOFF_BASE_SECONDS, max=BACKOFF_MAX_SECONDS
+            )
+            + wait_random(0, BACKOFF_JITTER_SECONDS),
+            "retry": retry_if_exception(is_retryable_error),
+            "before_sleep": self._log_backoff,
+            "reraise": True,
+        }
+
+    def _log_backoff(self, retry_state: RetryCallState) -> None:
+        """Log a transient error before sleeping for the next attempt."""
+        error = retry_state.outcome.exception() if retry_state.outcome else None
+        sleep_seconds = retry_state.next_action.sleep if retry_state.next_action else 0
+        logger.warning(
+            f"Transient error from {self.model} on attempt "
+            f"{retry_state.attempt_number}/{self.max_retries + 1}, "
+            f"retrying in {sleep_seconds:.1f}s: {error}"
+        )
+
+    def query_in_executor(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        executor: Optional[Executor],
+        prompt: str,
+        n: int = 1,
+        system_prompt: Optional[str] = None,
+        **kwargs,
+    ) -> "asyncio.Future[list[str]]":
+        """Run query() on an executor so async callers can overlap requests.
+
+        The HTTP call releases the GIL while waiting on the network, so a
+        thread pool lets several games wait on their LLMs concurrently
+        without the synchronous callers changing.
+
+        Args:
+            loop: Event loop that awaits the result.
+            executor: Executor to run on, or None for the loop's default.
+            prompt: User message to send.
+            n: Number of completions to request.
+            system_prompt: Optional system-level instructions.
+            **kwargs: Additional params passed to litellm.completion.
+
+        Returns:
+            Future resolving to the same list query() would return.
+        """
+        return loop.run_in_executor(
+            executor,
+            functools.partial(
+                self.query, prompt, n=n, system_prompt=system_prompt, **kwargs
+            ),
+        )
+
+    @classmethod
+    def batch_query_models(
+        cls,
+        models: list[str],
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **connector_kwargs,
+    ) -> dict[str, list[str]]:
+        """Send one prompt to several models concurrently.
+
+        Every query is submitted before any result is awaited, so the batch
+        takes about as long as the slowest model rather than the sum.
+
+        Args:
+            models: Model identifiers to query. A model listed more than once
+                is queried once, since results are keyed by model.
+            prompt: User message sent to every model.
+            system_prompt: Optional system-level instructions.
+            **connector_kwargs: Settings for each model's connector
+                (temperature, max_tokens, timeout, ...).
+
+        Returns:
+            Completions keyed by model, in the order each model first appears.
+
+        Raises:
+            TimeoutError: A model's request exceeded its timeout.
+            ConnectionError: A model's API call failed. The first failure in
+                model order is raised once every query has finished.
+        """
+        if not models:
+            return {}
+        connectors = [
+            cls(model=model, **connector_kwargs) for model in dict.fromkeys(models)
+        ]
+        with ThreadPoolExecutor(max_workers=len(connectors)) as executor:
+            futures = {
+                connector.model: executor.submit(
+                    connector.query, prompt, system_prompt=system_prompt
+                )
+                for connector in connectors
+            }
+            return {model: future.result() for model, future in futures.items()}
@@ -1,4 +1,6 @@
+import functools
 import re
+import string
 from abc import ABC, abstractmethod
 from typing import Optional
 
@@ -44,6 +46,17 @@ class BaseLLMMoveHandler(ABC):
         """Generate move request prompt with provided context."""
         return self._fill_prompt_template(self.prompt_template, **kwargs)
 
+    def get_prompts(self, batch: list[dict]) -> list[str]:
+        """Generate one move request prompt per context in batch.
+
+        Args:
+            batch: Keyword arguments for get_prompt, one dict per prompt.
+
+        Returns:
+            Prompts in the same order as batch.
+        """
+        return [self.get_prompt(**kwargs) for kwargs in batch]
+
     def get_retry_prompt(
         self,
         exception_name: str,
@@ -74,8 +87,16 @@ class BaseLLMMoveHandler(ABC):
         Raises:
             KeyError: If template requires a field not in kwargs.
         """
+        template_parts = _parse_prompt_template(template)
         try:
-            return template.format(**kwargs)
+            if template_parts is None:
+                return template.format(**kwargs)
+            prompt_parts = []
+            for literal, field_name in template_parts:
+                prompt_parts.append(literal)
+                if field_name is not None:
+                    prompt_parts.append(format(kwargs[field_name]))
+            return "".join(prompt_parts)
         except KeyError as e:
             raise KeyError(
                 f"Template requires field {e} which was not provided. "
@@ -96,6 +117,27 @@ class BaseLLMMoveHandler(ABC):
         pass
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_prompt_template(
+    template: str,
+) -> Optional[tuple[tuple[str, Optional[str]], ...]]:
+    """Split a template into (literal, field_name) pairs, parsed once per template.
+
+    Returns None when any field uses positional, attribute, index, conversion
+    or format-spec syntax, so those templates keep going through str.format.
+    """
+    template_parts = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(
+        template
+    ):
+        if field_name is not None and (
+            not field_name.isidentifier() or format_spec or conversion
+        ):
+            return None
+        template_parts.append((literal, field_name))
+    return tuple(template_parts)
+
+
 GAME_ARENA_PROMPT_TEMPLATE = """Let's play chess. The current game state in FEN is:
 {board_in_fen}
 The moves played so far are:
@@ -119,6 +161,18 @@ GAME_ARENA_AMBIGUOUS_MOVE_TEMPLATE = """{last_prompt}
 Your previously suggested move was: {last_attempted_move}, which is ambiguous (multiple pieces can make this move).
 Please think carefully and generate a new and unambiguous move."""
 
+# Final answer markers in priority order, lowercased for case-insensitive search
+_FINAL_ANSWER_MARKERS = (
+    "final answer:",
+    "the final answer is",
+    "my final answer is",
+)
+_HTML_TAG_PATTERN = re.compile(r"<.*?>")
+_MOVE_TEXT_DELIMITER_PATTERN = re.compile(r"[\s,;.!]")
+_MOVE_NUMBER_PATTERN = re.compile(r"(\d+)(\.+)\s*(.*)")
+# Symbols that python-chess rejects, deleted in one translate() pass
+_NON_MOVE_SYMBOLS_TABLE = str.maketrans("", "", ":.*,&^\\<>{}[]?!")
+
 
 class GameArenaLLMMoveHandler(BaseLLMMoveHandler):
     """Handler using Game Arena's 'Final Answer: X' pattern.
@@ -153,29 +207,22 @@ class GameArenaLLMMoveHandler(BaseLLMMoveHandler):
         return move_text
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _extract_raw_move_text(response: str) -> Optional[str]:
-        """Extract move text after 'Final Answer:' marker or simple move notation."""
+        """Extract move text after 'Final Answer:' marker or simple move notation.
+
+        Memoized since the extraction is pure and cached responses, votes and
+        replayed logs hand the same text back repeatedly.
+        """
         if not response:
             return None
 
-        # Try multiple variations of the final answer marker
-        markers = [
-            "Final Answer:",
-            "final answer:",
-            "Final answer:",
-            "The final answer is",
-            "the final answer is",
-            "My final answer is",
-            "my final answer is",
-        ]
-
         index = -1
         marker_len = 0
         response_lower = response.lower()
 
-        for marker in markers:
-            marker_lower = marker.lower()
-            found_index = response_lower.rfind(marker_lower)
+        for marker in _FINAL_ANSWER_MARKERS:
+            found_index = response_lower.rfind(marker)
             if found_index != -1:
                 index = found_index
                 marker_len = len(marker)
@@ -214,7 +261,7 @@ class GameArenaLLMMoveHandler(BaseLLMMoveHandler):
             .replace("\n", " ")
         )
 
-        raw_move_text = re.sub(r"<.*?>", "", raw_move_text)
+        raw_move_text = _HTML_TAG_PATTERN.sub("", raw_move_text)
 
         # Handle castling notation with spaces first (e.g., "O - O" or "O - O - O")
         if raw_move_text.strip().upper().replace(" ", "").replace("-", "") in [
@@ -226,12 +273,13 @@ class GameArenaLLMMoveHandler(BaseLLMMoveHandler):
         else:
             # For non-castling moves, take only the first word (prevents 'e4 therefore...' misparsing)
             # Split on whitespace and common punctuation that might follow a move
-            parts = re.split(r"[\s,;.!]", raw_move_text.strip())
+            parts = _MOVE_TEXT_DELIMITER_PATTERN.split(raw_move_text.strip())
             raw_move_text = parts[0] if parts else ""
 
         return raw_move_text
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _sanitize_move_text(raw_move_text: str) -> Optional[str]:
         """Remove move numbers and non-chess punctuation."""
         if not raw_move_text:
@@ -240,31 +288,14 @@ class GameArenaLLMMoveHandler(BaseLLMMoveHandler):
         sanitized_move_text = raw_move_text.strip()
 
         if sanitized_move_text and sanitized_move_text[0].isdigit():
-            match = re.match(r"(\d+)(\.+)\s*(.*)", sanitized_move_text)
+            match = _MOVE_NUMBER_PATTERN.match(sanitized_move_text)
             if match:
                 sanitized_move_text = match.group(3)
             else:
                 return None
 
         # Strip symbols that python-chess rejects to increase parse success
-        for char in [
-            ":",
-            ".",
-            "*",
-            ",",
-            "&",
-            "^",
-            "\\",
-            "<",
-            ">",
-            "{",
-            "}",
-            "[",
-            "]",
-            "?",
-            "!",
-        ]:
-            sanitized_move_text = sanitized_move_text.replace(char, "")
+        sanitized_move_text = sanitized_move_text.translate(_NON_MOVE_SYMBOLS_TABLE)
 
         # LLMs sometimes output "exd6ep" but python-chess expects just "exd6"
         if sanitized_move_text.endswith("ep"):
@@ -1,4 +1,3 @@
-from collections import Counter
 from typing import Optional
 from loguru import logger
 
@@ -64,8 +63,10 @@ class LLMPlayer(BasePlayer):
         Returns:
             Player decision (move or resignation)
         """
+        # Context is immutable during retries, so serialize it only once
+        context_kwargs = context.model_dump()
         # Must initialize prompt outside loop to preserve retry context across iterations
-        prompt = self.handler.get_prompt(**context.model_dump())
+        prompt = self.handler.get_prompt(**context_kwargs)
 
         for attempt in range(self.max_move_retries + 1):
             logger.debug(
@@ -88,6 +89,11 @@ class LLMPlayer(BasePlayer):
                 )
                 raise
 
+            if decision.action == "resign":
+                # A well-formed resignation needs no validation or retry
+                logger.info(f"LLM player {self} resigned on attempt {attempt + 1}")
+                return decision
+
             try:
                 self._validate_player_decision_from_llm(decision, context.board_in_fen)
                 logger.info(
@@ -109,7 +115,7 @@ class LLMPlayer(BasePlayer):
                         last_prompt=prompt,
                         last_response=decision.response,
                         last_attempted_move=decision.attempted_move,
-                        **context.model_dump(),
+                        **context_kwargs,
                     )
                     logger.debug(
                         f"Generated retry prompt with error context for {e.__class__.__name__}"
@@ -133,16 +139,16 @@ class LLMPlayer(BasePlayer):
         decision: PlayerDecision,
         board_in_fen: str,
     ) -> PlayerDecision:
-        """Get the player's action from the LLM.
+        """Validate a move decision from the LLM and convert it to UCI format.
 
-        If the action is a move, we validate it and convert to UCI format.
+        Resignations are handled by the caller before validation.
 
         Args:
-            prompt: The prompt to send to the LLM
-            context: Current game context for validation
+            decision: Decision parsed from the LLM response
+            board_in_fen: Current position used for legality checks
 
         Returns:
-            Validated PlayerDecision with move in UCI format if applicable, or resignation.
+            Validated PlayerDecision with move in UCI format.
 
         Raises:
             NotImplementedError: If LLM returned unsupported action
@@ -152,9 +158,6 @@ class LLMPlayer(BasePlayer):
 
         """
 
-        if decision.action == "resign":
-            return decision
-
         if decision.action != "move":
             raise NotImplementedError(
                 f"LLM currently only supports 'move' and 'resign' actions, "
@@ -184,6 +187,14 @@ class LLMPlayer(BasePlayer):
             f"Requested {self.num_votes} response(s) from LLM for majority voting"
         )
         decisions = []
+        # Votes are tallied by hand since num_votes is typically tiny (1-7):
+        # tracking leader/runner-up while counting avoids Counter's heap and a
+        # second pass for tie detection
+        vote_counts: dict[tuple[str, str | None], int] = {}
+        first_vote_positions: dict[tuple[str, str | None], int] = {}
+        most_voted_tuple: tuple[str, str | None] | None = None
+        vote_count = 0
+        runner_up_vote_count = 0
 
         # Handle parsing errors per response to avoid breaking the entire voting
         for idx, response in enumerate(responses):
@@ -191,6 +202,26 @@ class LLMPlayer(BasePlayer):
                 decision = self.handler.parse_decision_from_response(response)
                 if decision is not None:
                     decisions.append(decision)
+                    decision_tuple = (decision.action, decision.attempted_move)
+                    first_vote_positions.setdefault(
+                        decision_tuple, len(first_vote_positions)
+                    )
+                    count = vote_counts[decision_tuple] = (
+                        vote_counts.get(decision_tuple, 0) + 1
+                    )
+                    # On ties the decision that was voted for first leads
+                    if count > vote_count or (
+                        count == vote_count
+                        and most_voted_tuple is not None
+                        and first_vote_positions[decision_tuple]
+                        < first_vote_positions[most_voted_tuple]
+                    ):
+                        if decision_tuple != most_voted_tuple:
+                            runner_up_vote_count = vote_count
+                            most_voted_tuple = decision_tuple
+                        vote_count = count
+                    elif decision_tuple != most_voted_tuple:
+                        runner_up_vote_count = max(runner_up_vote_count, count)
                     logger.debug(
                         f"Vote {idx + 1}/{len(responses)}: Parsed move '{decision.attempted_move}' "
                         f"from response"
@@ -201,11 +232,21 @@ class LLMPlayer(BasePlayer):
                 )
                 # Continue with other responses instead of crashing
 
+            num_remaining_votes = len(responses) - idx - 1
+            if num_remaining_votes and self._is_majority_locked(
+                vote_count, runner_up_vote_count, num_remaining_votes
+            ):
+                logger.debug(
+                    f"Majority locked after {idx + 1}/{len(responses)} votes, "
+                    f"skipping the remaining {num_remaining_votes}"
+                )
+                break
+
         logger.debug(
             f"Successfully parsed {len(decisions)}/{len(responses)} responses for voting"
         )
 
-        if not decisions:
+        if not decisions or most_voted_tuple is None:
             # All responses failed to parse, in which case we create a
             # fake desicion to trigger a retry
             logger.error("All LLM responses failed to parse, triggering retry ...")
@@ -216,20 +257,14 @@ class LLMPlayer(BasePlayer):
             )
 
         # Majority voting implementation:
-        # 1. Convert decisions to tuples (action, attempted_move) for counting
-        #    since Pydantic models aren't hashable
-        # 2. Count occurrences of each unique decision
-        # 3. Select the most common decision
-        # 4. Ties are broken by first occurrence (Counter preserves insertion order)
-        decision_tuples = [(d.action, d.attempted_move) for d in decisions]
-        vote_counts = Counter(decision_tuples)
-        most_voted_tuple, vote_count = vote_counts.most_common(1)[0]
-
-        # Check for ties and log them explicitly
-        ties = [t for t, c in vote_counts.items() if c == vote_count]
-        if len(ties) > 1:
+        # 1. Decisions were tallied as (action, attempted_move) tuples while
+        #    parsing, since Pydantic models aren't hashable
+        # 2. The leader was tracked during tallying
+        # 3. Ties are broken by first occurrence of the tied decisions
+        if runner_up_vote_count == vote_count:
+            num_tied = sum(1 for c in vote_counts.values() if c == vote_count)
             logger.debug(
-                f"Tie in voting between {len(ties)} options with {vote_count} votes each. "
+                f"Tie in voting between {num_tied} options with {vote_count} votes each. "
                 f"Selecting first occurrence: {most_voted_tuple}"
             )
         else:
@@ -259,8 +294,27 @@ class LLMPlayer(BasePlayer):
 
         return most_voted_decision
 
+    @staticmethod
+    def _is_majority_locked(
+        leader_vote_count: int,
+        runner_up_vote_count: int,
+        num_remaining_votes: int,
+    ) -> bool:
+        """Check whether the remaining votes can no longer change the winner.
+
+        Args:
+            leader_vote_count: Votes for the current leading decision.
+            runner_up_vote_count: Votes for the best other decision.
+            num_remaining_votes: Number of samples not yet tallied.
+
+        Returns:
+            True if the leader's margin exceeds the votes still outstanding.
+        """
+        return leader_vote_count > runner_up_vote_count + num_remaining_votes
+
     def close(self) -> None:
-        """Clean up LLM connector resources if needed."""
+        """Clean up LLM connector resources and the move-parsing cache."""
+        parse_attempted_move_to_uci.cache_clear()
         if hasattr(self.connector, "close"):
             try:
                 self.connector.close()
@@ -0,0 +1,194 @@
+"""Minimal UCI engine client speaking directly over stdin/stdout pipes.
+
+``chess.engine.SimpleEngine`` runs an asyncio event loop in a helper thread
+per engine and marshals every command through it. For the plain
+``position fen ... / go ... / bestmove`` cycle a player needs, that costs a
+thread hand-off on every call. This client writes commands and reads replies
+on the calling thread instead, at the price of supporting only that cycle.
+"""
+
+import re
+import subprocess
+from typing import Any, Dict
+
+import chess.engine
+from loguru import logger
+
+BESTMOVE_PATTERN = re.compile(r"^bestmove\s+(\S+)")
+
+# Seconds to wait for the engine to exit after "quit" before killing it
+QUIT_TIMEOUT_SECONDS = 2.0
+
+
+class RawUCIEngine:
+    """UCI engine process driven synchronously over its pipes.
+
+    Not thread-safe: each instance must be used by one thread at a time.
+    Reads block until the engine answers, so search limits should always be
+    bounded (depth, nodes, or time).
+    """
+
+    def __init__(self, process: subprocess.Popen[str]) -> None:
+        """Wrap an already started engine process.
+
+        Use popen() to start the process and perform the UCI handshake.
+
+        Args:
+            process: Engine process with text-mode stdin/stdout pipes.
+        """
+        self.process = process
+
+    @classmethod
+    def popen(cls, binary_path: str) -> "RawUCIEngine":
+        """Start an engine process and complete the UCI handshake.
+
+        Args:
+            binary_path: Path to the UCI engine executable.
+
+        Returns:
+            Engine ready to accept commands.
+
+        Raises:
+            OSError: If the process cannot be started.
+            chess.engine.EngineTerminatedError: If the engine exits during the
+                handshake.
+        """
+        process = subprocess.Popen(
+            [binary_path],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+        engine = cls(process)
+        try:
+            engine._send("uci")
+            engine._read_until("uciok")
+        except Exception:
+            engine.quit()
+            raise
+        logger.debug(f"Started raw UCI engine from {binary_path}")
+        return engine
+
+    def configure(self, options: Dict[str, Any]) -> None:
+        """Set UCI options and wait until the engine has applied them.
+
+        Args:
+            options: Option names mapped to values (e.g. {"Threads": 1}).
+        """
+        for name, value in options.items():
+            if isinstance(value, bool):
+                value = "true" if value else "false"
+            self._send(f"setoption name {name} value {value}")
+        self.ping()
+
+    def new_game(self) -> None:
+        """Tell the engine the next search belongs to a new game."""
+        self._send("ucinewgame")
+        self.ping()
+
+    def ping(self) -> None:
+        """Block until the engine reports it is ready for more commands."""
+        self._send("isready")
+        self._read_until("readyok")
+
+    def play(self, board_in_fen: str, limits: Dict[str, Any]) -> str:
+        """Search a position and return the engine's best move.
+
+        Args:
+            board_in_fen: Position to search.
+            limits: Search constraints accepted by chess.engine.Limit
+                (depth, nodes, time, mate, clocks and increments in seconds,
+                remaining_moves).
+
+        Returns:
+            Best move in UCI notation.
+
+        Raises:
+            ValueError: If the limits do not bound the search, which would
+                make the engine think forever.
+            chess.engine.EngineError: If the engine returns no move.
+            chess.engine.EngineTerminatedError: If the engine exits.
+        """
+        limit = chess.engine.Limit(**limits)
+        go_command = ["go"]
+        if limit.white_clock is not None:
+            go_command.append(f"wtime {_seconds_to_ms(limit.white_clock)}")
+        if limit.black_clock is not None:
+            go_command.append(f"btime {_seconds_to_ms(limit.black_clock)}")
+        if limit.white_inc is not None:
+            go_command.append(f"winc {_seconds_to_ms(limit.white_inc)}")
+        if limit.black_inc is not None:
+            go_command.append(f"binc {_seconds_to_ms(limit.black_inc)}")
+        if limit.remaining_moves is not None:
+            go_command.append(f"movestogo {limit.remaining_moves}")
+        if limit.depth is not None:
+            go_command.append(f"depth {limit.depth}")
+        if limit.nodes is not None:
+            go_command.append(f"nodes {limit.nodes}")
+        if limit.mate is not None:
+            go_command.append(f"mate {limit.mate}")
+        if limit.time is not None:
+            go_command.append(f"movetime {max(1, round(limit.time * 1000))}")
+        if len(go_command) == 1:
+            # A bare "go" searches until "stop", and nothing here sends one
+            raise ValueError(f"Search limits do not bound the search: {limits}")
+
+        self._send(f"position fen {board_in_fen}")
+        self._send(" ".join(go_command))
+        match = BESTMOVE_PATTERN.match(self._read_until("bestmove"))
+        best_move = match.group(1) if match else None
+        if best_move is None or best_move in ("(none)", "0000"):
+            raise chess.engine.EngineError(
+                f"Engine returned no best move for position: {board_in_fen}"
+            )
+        return best_move
+
+    def quit(self) -> None:
+        """Ask the engine to exit, killing it if it does not comply."""
+        try:
+            self._send("quit")
+            self.process.wait(timeout=QUIT_TIMEOUT_SECONDS)
+        except (OSError, subprocess.TimeoutExpired, chess.engine.EngineError):
+            self.process.kill()
+            self.process.wait()
+
+    def _send(self, line: str) -> None:
+        """Write one command line to the engine."""
+        if self.process.stdin is None or self.process.poll() is not None:
+            raise chess.engine.EngineTerminatedError(
+                f"Engine process exited with code {self.process.returncode}"
+            )
+        try:
+            self.process.stdin.write(line + "\n")
+            self.process.stdin.flush()
+        except BrokenPipeError as e:
+            raise chess.engine.EngineTerminatedError(
+                "Engine process died unexpectedly"
+            ) from e
+
+    def _read_until(self, prefix: str) -> str:
+        """Read engine output until a line starts with the given prefix.
+
+        Args:
+            prefix: Token the awaited reply starts with (e.g. "readyok").
+
+        Returns:
+            The matching line, without its trailing newline.
+
+        Raises:
+            chess.engine.EngineTerminatedError: If the engine exits first.
+        """
+        if self.process.stdout is not None:
+            for line in iter(self.process.stdout.readline, ""):
+                if line.startswith(prefix):
+                    return line.rstrip("\n")
+        raise chess.engine.EngineTerminatedError(
+            f"Engine process died while waiting for '{prefix}'"
+        )
+
+
+def _seconds_to_ms(seconds: float) -> int:
+    """Convert a clock or increment in seconds to UCI milliseconds."""
+    return max(0, round(seconds * 1000))
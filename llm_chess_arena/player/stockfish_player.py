@@ -1,5 +1,8 @@
 import os
+import queue
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -8,18 +11,54 @@ import chess.engine
 from loguru import logger
 
 from llm_chess_arena.player.base_player import BasePlayer
+from llm_chess_arena.player.raw_uci_engine import RawUCIEngine
+from llm_chess_arena.player.stockfish_pool import (
+    StockfishEnginePool,
+    get_default_engine_pool,
+)
 from llm_chess_arena.types import Color, PlayerDecisionContext, PlayerDecision
 
 # Default depth prevents infinite analysis when limits not specified
 DEFAULT_ENGINE_LIMITS = {"depth": 10}
 
+# Resolved binary paths keyed by (explicit path, STOCKFISH_BINARY_PATH), so
+# repeated player construction skips the PATH scan and filesystem probes
+_BINARY_PATH_CACHE: Dict[tuple[Optional[str], Optional[str]], str] = {}
+
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """Stat a path with a single syscall, returning None if it is missing."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _is_executable_file(path_stat: os.stat_result) -> bool:
+    """Check a stat result for a non-directory with any execute bit set."""
+    return not stat.S_ISDIR(path_stat.st_mode) and bool(path_stat.st_mode & 0o111)
+
+
+def reset_binary_cache() -> None:
+    """Forget resolved Stockfish binary paths.
+
+    Call after installing, moving, or replacing the Stockfish binary so the
+    next StockfishPlayer searches the filesystem again.
+    """
+    _BINARY_PATH_CACHE.clear()
+
 
 class StockfishPlayer(BasePlayer):
     """Chess player powered by Stockfish engine.
 
-    Uses lazy initialization: engine subprocess starts only on first move request.
+    Uses lazy initialization: engine is acquired only on first move request.
     This prevents hanging processes if game init fails after player creation.
 
+    Engines come from a StockfishEnginePool and are returned to it on close(),
+    so consecutive games reuse warm processes instead of respawning them.
+    With use_raw_uci=True the player instead owns a RawUCIEngine, which skips
+    python-chess's per-engine event-loop thread for faster shallow searches.
+
     Note:
         Call close() explicitly for clean shutdown, or use try/finally.
         If program crashes after engine starts, subprocess may linger requiring manual kill.
@@ -33,6 +72,8 @@ class StockfishPlayer(BasePlayer):
         binary_path: Optional[str] = None,
         engine_limits: Optional[Dict[str, Any]] = None,
         engine_options: Optional[Dict[str, Any]] = None,
+        engine_pool: Optional[StockfishEnginePool] = None,
+        use_raw_uci: bool = False,
     ) -> None:
         """Initialize Stockfish player configuration.
 
@@ -46,6 +87,10 @@ class StockfishPlayer(BasePlayer):
             binary_path: Explicit path or None to auto-detect.
             engine_limits: Search constraints (depth, time, nodes).
             engine_options: UCI configuration (threads, skill level).
+            engine_pool: Pool to borrow engines from; defaults to the
+                process-wide pool.
+            use_raw_uci: Drive a dedicated engine over raw UCI pipes for
+                per-move decisions instead of a pooled SimpleEngine.
 
         Raises:
             FileNotFoundError: If binary not found during path resolution.
@@ -53,9 +98,17 @@ class StockfishPlayer(BasePlayer):
         super().__init__(name, color)
 
         self.engine: Optional[chess.engine.SimpleEngine] = None
+        self.raw_engine: Optional[RawUCIEngine] = None
+        self.use_raw_uci = use_raw_uci
         self.binary_path = self._find_stockfish_binary(binary_path)
         self.engine_limits = engine_limits or DEFAULT_ENGINE_LIMITS
         self.engine_options = engine_options or {}
+        self.engine_pool = engine_pool or get_default_engine_pool()
+        # Identifies this borrowing to the engine so a reused process starts
+        # a new game (ucinewgame) instead of continuing the previous one
+        self._engine_game_token: Optional[object] = None
+        # Reloaded from FEN on every move instead of building a new Board
+        self._scratch_board: Optional[chess.Board] = None
 
         logger.debug(
             f"StockfishPlayer configured with limits={self.engine_limits} (engine not started yet)"
@@ -63,7 +116,32 @@ class StockfishPlayer(BasePlayer):
 
     @staticmethod
     def _find_stockfish_binary(explicit_path: Optional[str] = None) -> str:
-        """Locate Stockfish binary.
+        """Locate Stockfish binary, reusing earlier successful lookups.
+
+        Failed lookups are not cached. Use reset_binary_cache() to force a
+        fresh search.
+
+        Args:
+            explicit_path: Explicit path or None for auto-detection.
+
+        Returns:
+            Resolved path to executable.
+
+        Raises:
+            FileNotFoundError: If not found anywhere.
+        """
+        cache_key = (explicit_path, os.getenv("STOCKFISH_BINARY_PATH"))
+        cached_path = _BINARY_PATH_CACHE.get(cache_key)
+        if cached_path is not None:
+            return cached_path
+
+        resolved_path = StockfishPlayer._search_stockfish_binary(explicit_path)
+        _BINARY_PATH_CACHE[cache_key] = resolved_path
+        return resolved_path
+
+    @staticmethod
+    def _search_stockfish_binary(explicit_path: Optional[str] = None) -> str:
+        """Search the filesystem for the Stockfish binary.
 
         Search order: explicit path, env var, PATH, common locations.
 
@@ -78,9 +156,10 @@ class StockfishPlayer(BasePlayer):
         """
         if explicit_path:
             path = Path(explicit_path)
-            if not path.exists():
+            path_stat = _stat_or_none(path)
+            if path_stat is None:
                 raise FileNotFoundError(f"Stockfish binary not found at: {path}")
-            if not os.access(str(path), os.X_OK):
+            if not _is_executable_file(path_stat):
                 raise FileNotFoundError(
                     f"Stockfish binary exists but is not executable at: {path}\n"
                     f"Try: chmod +x {path}"
@@ -90,12 +169,13 @@ class StockfishPlayer(BasePlayer):
         env_path = os.getenv("STOCKFISH_BINARY_PATH")
         if env_path:
             path = Path(env_path)
-            if not path.exists():
+            path_stat = _stat_or_none(path)
+            if path_stat is None:
                 logger.warning(
                     f"Environment variable STOCKFISH_BINARY_PATH set to"
                     f" {path}, but file does not exist."
                 )
-            elif not os.access(str(path), os.X_OK):
+            elif not _is_executable_file(path_stat):
                 logger.warning(
                     f"Stockfish binary from STOCKFISH_BINARY_PATH exists but"
                     f" is not executable: {path}"
@@ -120,7 +200,8 @@ class StockfishPlayer(BasePlayer):
         ]
         for common_path in common_paths:
             path = Path(common_path)
-            if path.exists() and os.access(str(path), os.X_OK):
+            path_stat = _stat_or_none(path)
+            if path_stat is not None and _is_executable_file(path_stat):
                 logger.debug(f"Found Stockfish binary in common path: {path}")
                 return str(path.resolve())
 
@@ -136,7 +217,7 @@ class StockfishPlayer(BasePlayer):
         )
 
     def _start_engine(self) -> None:
-        """Start the Stockfish engine subprocess (lazy initialization).
+        """Acquire a Stockfish engine from the pool (lazy initialization).
 
         Raises:
             RuntimeError: If engine initialization fails.
@@ -145,18 +226,39 @@ class StockfishPlayer(BasePlayer):
             return
 
         try:
-            self.engine = chess.engine.SimpleEngine.popen_uci(self.binary_path)
-            self.engine.configure(self.engine_options)
+            self.engine = self.engine_pool.acquire(
+                self.binary_path, self.engine_options
+            )
+            self._engine_game_token = object()
             logger.info(f"Stockfish engine started with limits={self.engine_limits}")
         except Exception as e:
-            if self.engine:
-                try:
-                    self.engine.quit()
-                except Exception:
-                    pass
-                self.engine = None
+            self.engine = None
             raise RuntimeError(f"Failed to initialize Stockfish engine: {e}") from e
 
+    def _start_raw_engine(self) -> None:
+        """Start a dedicated raw UCI engine (lazy initialization).
+
+        Raises:
+            RuntimeError: If engine initialization fails.
+        """
+        if self.raw_engine is not None:
+            return
+
+        try:
+            raw_engine = RawUCIEngine.popen(self.binary_path)
+        except Exception as e:
+            raise RuntimeError(f"Failed to initialize Stockfish engine: {e}") from e
+        try:
+            raw_engine.configure(self.engine_options)
+            raw_engine.new_game()
+        except Exception as e:
+            raw_engine.quit()
+            raise RuntimeError(f"Failed to initialize Stockfish engine: {e}") from e
+        self.raw_engine = raw_engine
+        logger.info(
+            f"Raw UCI Stockfish engine started with limits={self.engine_limits}"
+        )
+
     def _make_decision(self, context: PlayerDecisionContext) -> PlayerDecision:
         """Query Stockfish for best move.
 
@@ -169,15 +271,124 @@ class StockfishPlayer(BasePlayer):
         Raises:
             RuntimeError: If engine fails or cannot be started.
         """
+        if self.use_raw_uci:
+            if self.raw_engine is None:
+                self._start_raw_engine()
+            try:
+                best_move = self.raw_engine.play(
+                    context.board_in_fen, self.engine_limits
+                )
+            except chess.engine.EngineError as e:
+                raise RuntimeError(f"Stockfish failed to generate move: {e}") from e
+            return PlayerDecision(action="move", attempted_move=best_move)
+
         if self.engine is None:
             self._start_engine()
+        if self._scratch_board is None:
+            self._scratch_board = chess.Board()
+
+        return self._play_best_move(
+            self.engine,
+            self._scratch_board,
+            context.board_in_fen,
+            self._engine_game_token,
+        )
+
+    def decide_batch(
+        self,
+        contexts: list[PlayerDecisionContext],
+        max_workers: Optional[int] = None,
+    ) -> list[PlayerDecision]:
+        """Score many positions in parallel, one single-threaded engine per worker.
+
+        Running several single-threaded engines concurrently is more efficient
+        than one multi-threaded engine searching positions sequentially, so
+        this is the path for bulk analysis (e.g. annotating a whole game).
+
+        Args:
+            contexts: Positions to decide on.
+            max_workers: Number of engines to run; defaults to the CPU count.
 
+        Returns:
+            Decisions in the same order as contexts.
+
+        Raises:
+            RuntimeError: If any engine fails or cannot be started.
+        """
+        if not contexts:
+            return []
+
+        num_workers = min(len(contexts), max_workers or os.cpu_count() or 1)
+        # Threads=1 per engine; parallelism comes from the number of engines
+        batch_engine_options = {**self.engine_options, "Threads": 1}
+        pending_contexts: queue.SimpleQueue[tuple[int, PlayerDecisionContext]] = (
+            queue.SimpleQueue()
+        )
+        for index, context in enumerate(contexts):
+            pending_contexts.put((index, context))
+        decisions: list[Optional[PlayerDecision]] = [None] * len(contexts)
+
+        def drain_pending_contexts() -> None:
+            try:
+                engine = self.engine_pool.acquire(
+                    self.binary_path, batch_engine_options
+                )
+            except Exception as e:
+                raise RuntimeError(f"Failed to initialize Stockfish engine: {e}") from e
+            # Workers run concurrently, so each needs its own scratch board
+            scratch_board = chess.Board()
+            try:
+                while True:
+                    try:
+                        index, context = pending_contexts.get_nowait()
+                    except queue.Empty:
+                        return
+                    # Positions are unrelated, so each is its own game
+                    decisions[index] = self._play_best_move(
+                        engine, scratch_board, context.board_in_fen, object()
+                    )
+            finally:
+                self.engine_pool.release(engine)
+
+        logger.debug(f"Scoring {len(contexts)} positions with {num_workers} engines")
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            workers = [
+                executor.submit(drain_pending_contexts) for _ in range(num_workers)
+            ]
+            for worker in workers:
+                worker.result()
+
+        return [decision for decision in decisions if decision is not None]
+
+    def _play_best_move(
+        self,
+        engine: chess.engine.SimpleEngine,
+        scratch_board: chess.Board,
+        board_in_fen: str,
+        game_token: Optional[object],
+    ) -> PlayerDecision:
+        """Ask an engine for its best move in a position.
+
+        Args:
+            engine: Engine to search with.
+            scratch_board: Board overwritten with the position; the engine
+                only reads it to build the UCI position command.
+            board_in_fen: Position to search.
+            game_token: Identifies the game so the engine resets between games.
+
+        Returns:
+            Decision with engine's best move.
+
+        Raises:
+            RuntimeError: If the engine fails to produce a move.
+        """
         try:
-            # Fresh board from FEN respects DTO pattern and avoids state mutation
-            board = chess.Board(context.board_in_fen)
+            # Reloading the scratch board from FEN keeps the DTO pattern (no
+            # state carried between moves) without allocating a Board per move
+            scratch_board.set_fen(board_in_fen)
 
             limit = chess.engine.Limit(**self.engine_limits)
-            result = self.engine.play(board, limit)
+            result = engine.play(scratch_board, limit, game=game_token)
 
             if result.move is None:
                 raise chess.engine.EngineError(
@@ -190,17 +401,28 @@ class StockfishPlayer(BasePlayer):
             raise RuntimeError(f"Stockfish failed to generate move: {e}") from e
 
     def close(self) -> None:
-        """Gracefully terminate engine process.
+        """Return the engine to the pool for reuse by later players.
 
-        IMPORTANT: Always call this method or use with a try-finally block
-        to prevent hanging Stockfish processes. The engine subprocess will
-        continue running even after Python exceptions if not properly closed.
+        A raw UCI engine, if one was started, is not pooled and is quit.
+
+        IMPORTANT: Always call this method or use with a try-finally block.
+        An engine that is never released stays with this player and is only
+        cleaned up when its subprocess is killed.
         """
         if self.engine is not None:
             try:
-                self.engine.quit()
-                logger.debug("Stockfish engine closed successfully")
+                self.engine_pool.release(self.engine)
+                logger.debug("Stockfish engine released successfully")
             except Exception as e:
-                logger.error(f"Error closing Stockfish engine: {e}")
+                logger.error(f"Error releasing Stockfish engine: {e}")
             finally:
                 self.engine = None
+                self._engine_game_token = None
+        if self.raw_engine is not None:
+            try:
+                self.raw_engine.quit()
+                logger.debug("Raw UCI Stockfish engine quit successfully")
+            except Exception as e:
+                logger.error(f"Error quitting raw UCI Stockfish engine: {e}")
+            finally:
+                self.raw_engine = None
@@ -0,0 +1,257 @@
+"""Pool of reusable Stockfish engine processes.
+
+Starting Stockfish (process spawn, UCI handshake, network weights load)
+dominates the cost of short games and shallow searches. Engines released by
+one player are kept idle and lent to the next player asking for the same
+binary, instead of being quit and respawned. UCI options are sticky: only
+options that differ from the engine's current configuration are sent.
+"""
+
+import atexit
+import queue
+import threading
+from typing import Any, Dict, Optional
+
+import chess.engine
+from loguru import logger
+
+# Idle engines hold their hash tables in memory, so keep only a few per binary
+DEFAULT_MAX_IDLE_ENGINES_PER_KEY = 4
+
+
+class StockfishEnginePool:
+    """Thread-safe pool lending Stockfish engines keyed by binary path.
+
+    Engines are acquired by players on their first move and released when the
+    player closes. Released engines are health-checked and kept idle for reuse;
+    a fresh game is signalled to the engine by the borrower (see
+    ``chess.engine.SimpleEngine.play``'s ``game`` argument), so no restart is
+    needed between players. Each engine's current UCI options are tracked, and
+    on acquire only the options that differ are reconfigured.
+    """
+
+    def __init__(
+        self, max_idle_engines_per_key: int = DEFAULT_MAX_IDLE_ENGINES_PER_KEY
+    ) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            max_idle_engines_per_key: Idle engines kept per binary; engines
+                released beyond this are quit.
+        """
+        self.max_idle_engines_per_key = max_idle_engines_per_key
+        self._idle_engines: Dict[str, queue.Queue[chess.engine.SimpleEngine]] = {}
+        self._lent_engine_keys: Dict[int, str] = {}
+        # UCI options last applied to each live engine, keyed by id(engine)
+        self._engine_options: Dict[int, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _get_idle_queue(self, key: str) -> queue.Queue[chess.engine.SimpleEngine]:
+        """Get (or create) the idle-engine queue for a binary path."""
+        with self._lock:
+            idle_queue = self._idle_engines.get(key)
+            if idle_queue is None:
+                idle_queue = queue.Queue(maxsize=self.max_idle_engines_per_key)
+                self._idle_engines[key] = idle_queue
+            return idle_queue
+
+    def acquire(
+        self,
+        binary_path: str,
+        engine_options: Optional[Dict[str, Any]] = None,
+    ) -> chess.engine.SimpleEngine:
+        """Lend an idle engine, or start a new one if none is available.
+
+        Args:
+            binary_path: Path to the Stockfish executable.
+            engine_options: UCI configuration for the engine. Options set by
+                a previous borrower but absent here are reset to defaults.
+
+        Returns:
+            A configured engine, owned by the caller until released.
+
+        Raises:
+            Exception: Any error from starting or configuring the engine.
+        """
+        engine_options = dict(engine_options or {})
+        try:
+            engine = self._get_idle_queue(binary_path).get_nowait()
+            logger.debug(f"Reusing pooled Stockfish engine for {binary_path}")
+        except queue.Empty:
+            engine = self._spawn_engine(binary_path, engine_options)
+        else:
+            try:
+                self._reconfigure_engine(engine, engine_options)
+            except Exception:
+                self._forget_engine(engine)
+                self._quit_engine(engine)
+                raise
+
+        with self._lock:
+            self._lent_engine_keys[id(engine)] = binary_path
+            self._engine_options[id(engine)] = engine_options
+        return engine
+
+    def _reconfigure_engine(
+        self, engine: chess.engine.SimpleEngine, engine_options: Dict[str, Any]
+    ) -> None:
+        """Send only the UCI options that differ from the engine's current ones.
+
+        Args:
+            engine: Idle engine about to be lent out.
+            engine_options: UCI configuration requested by the borrower.
+        """
+        with self._lock:
+            current_options = self._engine_options.get(id(engine), {})
+        changed_options = {
+            name: value
+            for name, value in engine_options.items()
+            if current_options.get(name) != value
+        }
+        for name in current_options.keys() - engine_options.keys():
+            option = engine.options.get(name)
+            changed_options[name] = option.default if option is not None else None
+        if changed_options:
+            logger.debug(f"Reconfiguring pooled Stockfish engine: {changed_options}")
+            engine.configure(changed_options)
+
+    def release(self, engine: chess.engine.SimpleEngine) -> None:
+        """Return a lent engine to the pool, or quit it if it cannot be reused.
+
+        Args:
+            engine: Engine previously returned by acquire().
+        """
+        with self._lock:
+            key = self._lent_engine_keys.pop(id(engine), None)
+        if key is None:
+            logger.warning("Releasing an engine not lent by this pool, quitting it")
+            self._quit_engine(engine)
+            return
+
+        try:
+            # Crashed or hung engines must not be lent to the next player
+            engine.ping()
+            self._get_idle_queue(key).put_nowait(engine)
+            logger.debug("Stockfish engine returned to pool")
+        except queue.Full:
+            self._forget_engine(engine)
+            self._quit_engine(engine)
+        except Exception as e:
+            logger.warning(f"Discarding unhealthy Stockfish engine: {e}")
+            self._forget_engine(engine)
+            self._quit_engine(engine)
+
+    def prewarm(
+        self,
+        binary_path: str,
+        engine_options: Optional[Dict[str, Any]] = None,
+        num_engines: int = 1,
+    ) -> None:
+        """Start engines ahead of time so the first moves skip startup.
+
+        Can be run in a background thread while players are being set up.
+
+        Args:
+            binary_path: Path to the Stockfish executable.
+            engine_options: UCI configuration for the engines.
+            num_engines: Number of idle engines to start (capped by the pool).
+        """
+        engine_options = dict(engine_options or {})
+        idle_queue = self._get_idle_queue(binary_path)
+        for _ in range(num_engines):
+            if idle_queue.full():
+                break
+            engine = self._spawn_engine(binary_path, engine_options)
+            with self._lock:
+                self._engine_options[id(engine)] = engine_options
+            try:
+                idle_queue.put_nowait(engine)
+            except queue.Full:
+                self._forget_engine(engine)
+                self._quit_engine(engine)
+                break
+
+    def close(self) -> None:
+        """Quit all idle engines. Engines still lent out are left to borrowers."""
+        with self._lock:
+            idle_queues = list(self._idle_engines.values())
+            self._idle_engines.clear()
+        for idle_queue in idle_queues:
+            while True:
+                try:
+                    engine = idle_queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._forget_engine(engine)
+                self._quit_engine(engine)
+
+    def _forget_engine(self, engine: chess.engine.SimpleEngine) -> None:
+        """Drop the tracked options of an engine that is leaving the pool."""
+        with self._lock:
+            self._engine_options.pop(id(engine), None)
+
+    @staticmethod
+    def _spawn_engine(
+        binary_path: str, engine_options: Optional[Dict[str, Any]]
+    ) -> chess.engine.SimpleEngine:
+        """Start and configure a new engine process."""
+        engine = chess.engine.SimpleEngine.popen_uci(binary_path)
+        try:
+            engine.configure(engine_options or {})
+        except Exception:
+            StockfishEnginePool._quit_engine(engine)
+            raise
+        logger.debug(f"Started new Stockfish engine from {binary_path}")
+        return engine
+
+    @staticmethod
+    def _quit_engine(engine: chess.engine.SimpleEngine) -> None:
+        """Quit an engine, ignoring errors from already-dead processes."""
+        try:
+            engine.quit()
+        except Exception as e:
+            logger.debug(f"Error quitting Stockfish engine: {e}")
+
+
+_default_engine_pool: Optional[StockfishEnginePool] = None
+_default_engine_pool_lock = threading.Lock()
+
+
+def get_default_engine_pool() -> StockfishEnginePool:
+    """Get the process-wide engine pool, creating it on first use.
+
+    Idle engines in the default pool are quit at interpreter exit.
+
+    Returns:
+        The shared StockfishEnginePool.
+    """
+    global _default_engine_pool
+
+    with _default_engine_pool_lock:
+        if _default_engine_pool is None:
+            _default_engine_pool = StockfishEnginePool()
+            _register_pool_shutdown(_default_engine_pool)
+        return _default_engine_pool
+
+
+def _register_pool_shutdown(pool: StockfishEnginePool) -> None:
+    """Quit a pool's idle engines when the interpreter exits.
+
+    Each engine runs a non-daemon event-loop thread, and the interpreter
+    joins those before plain atexit hooks run, so idle engines must be quit
+    from a threading-level exit hook (the same mechanism concurrent.futures
+    uses for its workers). That hook is private to CPython, so plain atexit
+    is used where it is missing.
+
+    Args:
+        pool: Pool to close at exit.
+    """
+    register_atexit = getattr(threading, "_register_atexit", atexit.register)
+    try:
+        register_atexit(pool.close)
+    except RuntimeError as e:
+        # threading refuses new exit hooks once interpreter shutdown started
+        logger.warning(
+            f"Cannot register Stockfish pool shutdown ({e}); "
+            "close idle engines explicitly with close()"
+        )
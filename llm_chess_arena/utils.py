@@ -1,3 +1,5 @@
+import functools
+
 import chess
 
 from llm_chess_arena.exceptions import (
@@ -7,16 +9,34 @@ from llm_chess_arena.exceptions import (
 )
 
 
+# Legal-move lists keyed by position, so positions that recur within or
+# across games skip move generation
+LEGAL_MOVES_CACHE_MAX_SIZE = 4096
+_LEGAL_MOVES_CACHE: dict[tuple, tuple[str, ...]] = {}
+
+
 def get_legal_moves_in_uci(board: chess.Board) -> list[str]:
     """Get all legal moves in UCI format from the current board state.
 
+    Results are cached by the board's transposition key (pieces, side to
+    move, castling rights and capturable en passant square), which is all
+    that move generation depends on; move clocks and history are ignored.
+
     Args:
         board: Current chess board state.
 
     Returns:
         List of legal moves in UCI notation (e.g., ["e2e4", "g1f3"]).
     """
-    return [move.uci() for move in board.legal_moves]
+    # Chess960 and variant boards encode or generate moves differently
+    position_key = (type(board), board.chess960, board._transposition_key())
+    legal_moves = _LEGAL_MOVES_CACHE.get(position_key)
+    if legal_moves is None:
+        legal_moves = tuple(move.uci() for move in board.legal_moves)
+        if len(_LEGAL_MOVES_CACHE) >= LEGAL_MOVES_CACHE_MAX_SIZE:
+            _LEGAL_MOVES_CACHE.clear()
+        _LEGAL_MOVES_CACHE[position_key] = legal_moves
+    return list(legal_moves)
 
 
 def get_move_history_in_uci(board: chess.Board) -> list[str]:
@@ -31,9 +51,14 @@ def get_move_history_in_uci(board: chess.Board) -> list[str]:
     return [move.uci() for move in board.move_stack]
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_attempted_move_to_uci(attempted_move: str, board_in_fen: str) -> str:
     """Parse a move string to UCI format, trying UCI first then SAN.
 
+    Results are memoized by (attempted_move, board_in_fen) since the parse is
+    pure and voting/retries often resubmit the same move for one position.
+    Failed parses raise and are therefore never cached.
+
     Args:
         attempted_move: Move text in UCI (e2e4) or SAN (Nf3, O-O).
         board_in_fen: FEN string representing the position.
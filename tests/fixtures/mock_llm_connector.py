@@ -1,6 +1,11 @@
+import re
+from collections import deque
 from typing import Optional, Dict, Any, List
 from llm_chess_arena.player.llm.llm_connector import LLMConnector
 
+# First non-empty "Legal moves:" line of a prompt, capturing the move list
+LEGAL_MOVES_LINE_PATTERN = re.compile(r"^Legal moves:[ \t]*(\S.*)$", re.MULTILINE)
+
 
 class MockLLMConnector(LLMConnector):
     """Mock LLM connector for testing without API calls."""
@@ -10,6 +15,9 @@ class MockLLMConnector(LLMConnector):
         model: str = "mock-model",
         responses: Optional[List[str]] = None,
         raise_on_query: Optional[Exception] = None,
+        temperature: float = 0.7,
+        timeout: float = 30.0,
+        max_retries: int = 3,
         **kwargs,
     ):
         """Initialize mock connector.
@@ -18,16 +26,20 @@ class MockLLMConnector(LLMConnector):
             model: Model name for testing.
             responses: Predetermined responses to return in order.
             raise_on_query: Exception to raise on query (for error testing).
+            temperature: Sampling temperature, stored only.
+            timeout: Request timeout in seconds, stored only.
+            max_retries: Retry count, stored only.
             **kwargs: Additional parameters captured but not used.
         """
         self.model = model
-        self.responses = responses or []
+        # deque so draining queued responses from the front is O(1) each
+        self.responses = deque(responses or [])
         self.raise_on_query = raise_on_query
         self.query_count = 0
         self.query_history = []
-        self.temperature = kwargs.get("temperature", 0.7)
-        self.timeout = kwargs.get("timeout", 30.0)
-        self.max_retries = kwargs.get("max_retries", 3)
+        self.temperature = temperature
+        self.timeout = timeout
+        self.max_retries = max_retries
 
     def query(
         self, prompt: str, system_prompt: Optional[str] = None, n: int = 1
@@ -54,29 +66,36 @@ class MockLLMConnector(LLMConnector):
         if self.raise_on_query:
             raise self.raise_on_query
 
+        # The fallback answer depends only on the prompt, so derive it once
+        # rather than rescanning the prompt for every sample
+        default_response = None
+        if len(self.responses) < n:
+            default_response = self._first_legal_move_response(prompt)
+
         responses = []
-        for i in range(n):
+        for _ in range(n):
             if self.responses:
-                response = self.responses.pop(0)  # Take from front of list
-                responses.append(response)
+                responses.append(self.responses.popleft())  # Take from front
             else:
-                # Extract first legal move from prompt for flexibility
-                if "Legal moves:" in prompt:
-                    lines = prompt.split("\n")
-                    for line in lines:
-                        if line.startswith("Legal moves:"):
-                            moves = line.replace("Legal moves:", "").strip()
-                            if moves:
-                                first_move = moves.split(",")[0].strip()
-                                responses.append(f"Final Answer: {first_move}")
-                                break
-                    else:
-                        responses.append("Final Answer: e4")  # Default opening move
-                else:
-                    responses.append("Final Answer: e4")  # Default opening move
+                responses.append(default_response)
 
         return responses
 
+    @staticmethod
+    def _first_legal_move_response(prompt: str) -> str:
+        """Answer with the first move from the prompt's "Legal moves:" line.
+
+        Args:
+            prompt: The prompt to scan.
+
+        Returns:
+            Response naming the first legal move, or e4 if none is listed.
+        """
+        match = LEGAL_MOVES_LINE_PATTERN.search(prompt)
+        if match:
+            return f"Final Answer: {match.group(1).split(',', 1)[0].strip()}"
+        return "Final Answer: e4"  # Default opening move
+
     def get_model_info(self) -> Dict[str, Any]:
         """Return mock model configuration."""
         return {
@@ -0,0 +1,118 @@
+"""Helper players, assertions and game builders shared by the test suite.
+
+Kept out of conftest.py so test modules can import them without loading
+conftest a second time under another module name.
+"""
+
+import functools
+
+import chess
+
+from llm_chess_arena.game import Game
+from llm_chess_arena.player.base_player import BasePlayer
+from llm_chess_arena.player.random_player import RandomPlayer
+from llm_chess_arena.types import PlayerDecision
+
+
+@functools.lru_cache(maxsize=None)
+def board_prototype(fen_string):
+    """Parse a FEN once per session; callers copy the prototype."""
+    return chess.Board(fen_string)
+
+
+# Helper Classes for Testing
+# These deliberately declare no __slots__: BasePlayer and RandomPlayer keep an
+# instance __dict__, so slotting only the helpers would save no memory. Slot
+# the player base classes first if per-instance size ever matters here.
+class ScriptedPlayer(BasePlayer):
+    """Player that plays a predetermined sequence of moves."""
+
+    def __init__(self, name, color, move_sequence):
+        super().__init__(name, color)
+        self.move_sequence = move_sequence
+        self.current_move_index = 0
+        # Reloaded per move; the opponent's replies aren't known up front, so
+        # the SAN sequence can't be translated to UCI ahead of time
+        self._scratch_board = chess.Board()
+
+    def _make_decision(self, context):
+        """Make decision from predetermined sequence."""
+        if self.current_move_index >= len(self.move_sequence):
+            raise ValueError("No more moves in sequence")
+        next_move_san = self.move_sequence[self.current_move_index]
+        self.current_move_index += 1
+
+        # Convert SAN to UCI
+        self._scratch_board.set_fen(context.board_in_fen)
+        move = self._scratch_board.parse_san(next_move_san)
+        return PlayerDecision(action="move", attempted_move=move.uci())
+
+
+class RecordingPlayer(RandomPlayer):
+    """RandomPlayer that records board states it observes."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.observed_board_fens = []
+
+    def _make_decision(self, context):
+        """Record board state and make random move."""
+        self.observed_board_fens.append(context.board_in_fen)
+        return super()._make_decision(context)
+
+
+class FailingPlayer(RandomPlayer):
+    """Player that fails after a certain number of moves."""
+
+    def __init__(self, fail_after_moves=2, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fail_after_moves = fail_after_moves
+        self.moves_requested_count = 0
+
+    def _make_decision(self, context):
+        """Fail after specified number of moves."""
+        self.moves_requested_count += 1
+        if self.moves_requested_count == self.fail_after_moves:
+            raise RuntimeError("Simulated player error")
+        return super()._make_decision(context)
+
+
+class IllegalMovePlayer(BasePlayer):
+    """Player that returns a specific illegal move."""
+
+    def __init__(self, name, color, illegal_move_uci="b1e4"):
+        super().__init__(name, color)
+        self.illegal_move_uci = illegal_move_uci
+
+    def _make_decision(self, context):
+        """Return an illegal move."""
+        return PlayerDecision(action="move", attempted_move=self.illegal_move_uci)
+
+
+# Assertion Helpers
+def assert_game_terminated(game, expected_termination, expected_winner=None):
+    """Helper to assert game termination state."""
+    assert game.finished
+    assert game.outcome is not None
+    assert game.outcome.termination == expected_termination
+    assert game.winner == expected_winner
+
+
+def assert_game_in_progress(game):
+    """Helper to assert game is still in progress."""
+    assert not game.finished
+    assert game.outcome is None
+    assert game.winner is None
+
+
+def setup_game_from_fen(fen_string, white_player=None, black_player=None):
+    """Create a game with a specific board position."""
+    if white_player is None:
+        white_player = RandomPlayer(name="White", color="white")
+    if black_player is None:
+        black_player = RandomPlayer(name="Black", color="black")
+    game = Game(white_player, black_player)
+    # Copying the cached prototype is far cheaper than game.board.set_fen(),
+    # which would re-parse the FEN on every call
+    game.board = board_prototype(fen_string).copy(stack=False)
+    return game
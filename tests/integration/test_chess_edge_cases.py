@@ -5,11 +5,25 @@ import chess
 from llm_chess_arena.game import Game
 from llm_chess_arena.player.random_player import RandomPlayer
 
+# Knights shuffling out and back until the position repeats three times
+_THREEFOLD_UCI = (
+    "g1f3",
+    "g8f6",  # Develop knights
+    "f3g1",
+    "f6g8",  # Move back
+    "g1f3",
+    "g8f6",  # Repeat position 1
+    "f3g1",
+    "f6g8",  # Move back again
+    "g1f3",
+    "g8f6",  # Repeat position 2 (threefold)
+)
+
 
 class TestChessEdgeCases:
     """Test special chess rules and edge cases in full game context."""
 
-    def test_en_passant_capture(self):
+    def test_en_passant_capture(self, board_factory):
         """Test that en passant captures work correctly in a game."""
         white = RandomPlayer(color="white", seed=42)
         black = RandomPlayer(color="black", seed=43)
@@ -17,12 +31,12 @@ class TestChessEdgeCases:
 
         # Set up position for en passant
         # White pawn on e5, black plays d7-d5
-        game.board = chess.Board(
+        game.board = board_factory(
             "rnbqkb1r/ppp1pppp/5n2/3pP3/8/8/PPPP1PPP/RNBQKBNR w KQkq d6 0 3"
         )
 
         # Now white can capture en passant
-        assert "e5d6" in [m.uci() for m in game.board.legal_moves]
+        assert chess.Move.from_uci("e5d6") in game.board.legal_moves
 
         # Make the en passant capture
         game.board.push_uci("e5d6")
@@ -31,17 +45,17 @@ class TestChessEdgeCases:
         assert game.board.piece_at(chess.D5) is None  # Black pawn removed
         assert game.board.piece_at(chess.D6) is not None  # White pawn on d6
 
-    def test_castling_kingside(self):
+    def test_castling_kingside(self, board_factory):
         """Test kingside castling mechanics."""
         white = RandomPlayer(color="white")
         black = RandomPlayer(color="black")
         game = Game(white, black)
 
         # Clear path for kingside castling
-        game.board = chess.Board("r3k2r/pppppppp/8/8/8/8/PPPPPPPP/R3K2R w KQkq - 0 1")
+        game.board = board_factory("r3k2r/pppppppp/8/8/8/8/PPPPPPPP/R3K2R w KQkq - 0 1")
 
         # Verify castling is legal
-        assert "e1g1" in [m.uci() for m in game.board.legal_moves]
+        assert chess.Move.from_uci("e1g1") in game.board.legal_moves
 
         # Perform castling
         game.board.push_uci("e1g1")
@@ -52,17 +66,17 @@ class TestChessEdgeCases:
         assert game.board.piece_at(chess.E1) is None
         assert game.board.piece_at(chess.H1) is None
 
-    def test_castling_queenside(self):
+    def test_castling_queenside(self, board_factory):
         """Test queenside castling mechanics."""
         white = RandomPlayer(color="white")
         black = RandomPlayer(color="black")
         game = Game(white, black)
 
         # Clear path for queenside castling
-        game.board = chess.Board("r3k2r/pppppppp/8/8/8/8/PPPPPPPP/R3K2R w KQkq - 0 1")
+        game.board = board_factory("r3k2r/pppppppp/8/8/8/8/PPPPPPPP/R3K2R w KQkq - 0 1")
 
         # Verify castling is legal
-        assert "e1c1" in [m.uci() for m in game.board.legal_moves]
+        assert chess.Move.from_uci("e1c1") in game.board.legal_moves
 
         # Perform castling
         game.board.push_uci("e1c1")
@@ -73,34 +87,34 @@ class TestChessEdgeCases:
         assert game.board.piece_at(chess.E1) is None
         assert game.board.piece_at(chess.A1) is None
 
-    def test_pawn_promotion(self):
+    def test_pawn_promotion(self, board_factory):
         """Test pawn promotion to different pieces."""
         white = RandomPlayer(color="white")
         black = RandomPlayer(color="black")
         game = Game(white, black)
 
         # White pawn ready to promote
-        game.board = chess.Board("8/P7/8/8/8/8/8/8 w - - 0 1")
+        game.board = board_factory("8/P7/8/8/8/8/8/8 w - - 0 1")
 
-        # All promotion options should be legal
-        legal_moves = [m.uci() for m in game.board.legal_moves]
-        assert "a7a8q" in legal_moves  # Queen
-        assert "a7a8r" in legal_moves  # Rook
-        assert "a7a8b" in legal_moves  # Bishop
-        assert "a7a8n" in legal_moves  # Knight
+        # All promotion options (queen, rook, bishop, knight) should be legal
+        promotions = {
+            chess.Move(chess.A7, chess.A8, promotion=piece_type)
+            for piece_type in (chess.QUEEN, chess.ROOK, chess.BISHOP, chess.KNIGHT)
+        }
+        assert promotions <= set(game.board.legal_moves)
 
         # Promote to queen
         game.board.push_uci("a7a8q")
         assert game.board.piece_at(chess.A8).piece_type == chess.QUEEN
 
-    def test_stalemate_detection(self):
+    def test_stalemate_detection(self, board_factory):
         """Test that stalemate is properly detected."""
         white = RandomPlayer(color="white")
         black = RandomPlayer(color="black")
         game = Game(white, black)
 
         # Classic stalemate position
-        game.board = chess.Board("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1")
+        game.board = board_factory("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1")
 
         # Verify it's stalemate
         assert game.board.is_stalemate()
@@ -108,28 +122,28 @@ class TestChessEdgeCases:
         assert not game.board.is_checkmate()
         assert game.board.result() == "1/2-1/2"
 
-    def test_insufficient_material_draw(self):
+    def test_insufficient_material_draw(self, board_factory):
         """Test draw by insufficient material."""
         white = RandomPlayer(color="white")
         black = RandomPlayer(color="black")
         game = Game(white, black)
 
         # King vs King
-        game.board = chess.Board("8/8/8/4k3/8/8/8/4K3 w - - 0 1")
+        game.board = board_factory("8/8/8/4k3/8/8/8/4K3 w - - 0 1")
         assert game.board.is_insufficient_material()
         assert game.board.is_game_over()
 
         # King and Bishop vs King
-        game.board = chess.Board("8/8/8/4k3/8/8/8/4KB2 w - - 0 1")
+        game.board = board_factory("8/8/8/4k3/8/8/8/4KB2 w - - 0 1")
         assert game.board.is_insufficient_material()
 
         # King and Knight vs King
-        game.board = chess.Board("8/8/8/4k3/8/8/8/4KN2 w - - 0 1")
+        game.board = board_factory("8/8/8/4k3/8/8/8/4KN2 w - - 0 1")
         assert game.board.is_insufficient_material()
 
         # King and two Knights vs King is NOT insufficient material in python-chess
         # (technically can mate but can't force it)
-        game.board = chess.Board("8/8/8/4k3/8/8/8/2N1KN2 w - - 0 1")
+        game.board = board_factory("8/8/8/4k3/8/8/8/2N1KN2 w - - 0 1")
         # python-chess considers this sufficient material
         assert not game.board.is_insufficient_material()
 
@@ -139,34 +153,20 @@ class TestChessEdgeCases:
         black = RandomPlayer(color="black")
         game = Game(white, black)
 
-        # Create a position that will repeat
-        moves = [
-            "Nf3",
-            "Nf6",  # Develop knights
-            "Ng1",
-            "Ng8",  # Move back
-            "Nf3",
-            "Nf6",  # Repeat position 1
-            "Ng1",
-            "Ng8",  # Move back again
-            "Nf3",
-            "Nf6",  # Repeat position 2 (threefold)
-        ]
-
-        for move in moves:
-            game.board.push_san(move)
+        for uci_move in _THREEFOLD_UCI:
+            game.board.push(chess.Move.from_uci(uci_move))
 
         # Should be able to claim draw
         assert game.board.can_claim_threefold_repetition()
 
-    def test_fifty_move_rule(self):
+    def test_fifty_move_rule(self, board_factory):
         """Test fifty-move rule detection."""
         white = RandomPlayer(color="white")
         black = RandomPlayer(color="black")
         game = Game(white, black)
 
         # Create a position with high halfmove clock (approaching 50-move rule)
-        game.board = chess.Board("8/8/8/3k4/3K4/8/8/8 w - - 99 50")
+        game.board = board_factory("8/8/8/3k4/3K4/8/8/8 w - - 99 50")
 
         # Make one more move to reach 100 half-moves (50 full moves)
         game.board.push_san("Kd3")
@@ -179,33 +179,28 @@ class TestChessEdgeCases:
 class TestComplexPositions:
     """Test complex game positions and scenarios."""
 
-    def test_pinned_piece_cannot_move(self):
+    def test_pinned_piece_cannot_move(self, board_factory):
         """Test that pinned pieces have restricted movement."""
         white = RandomPlayer(color="white")
         black = RandomPlayer(color="black")
         game = Game(white, black)
 
         # Knight pinned by bishop
-        game.board = chess.Board(
+        game.board = board_factory(
             "r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b KQkq - 0 4"
         )
         game.board.push_san("Be7")  # Move black bishop
         game.board.push_san("Bxf7+")  # White bishop checks, pinning knight
 
         # Black knight on f6 is pinned and can't move
-        legal_moves = list(game.board.legal_moves)
-        knight_moves = [
-            m
-            for m in legal_moves
-            if game.board.piece_at(m.from_square)
-            and game.board.piece_at(m.from_square).piece_type == chess.KNIGHT
-        ]
-
-        # The f6 knight should have no legal moves (it's pinned)
-        f6_knight_moves = [m for m in knight_moves if m.from_square == chess.F6]
-        assert len(f6_knight_moves) == 0
-
-    def test_discovered_check(self):
+        assert game.board.piece_type_at(chess.F6) == chess.KNIGHT
+
+        # The f6 knight should have no legal moves (it's pinned); move
+        # generation is restricted to f6 instead of filtering every move
+        f6_knight_moves = game.board.generate_legal_moves(from_mask=chess.BB_F6)
+        assert next(f6_knight_moves, None) is None
+
+    def test_discovered_check(self, board_factory):
         """Test discovered check scenario."""
         white = RandomPlayer(color="white")
         black = RandomPlayer(color="black")
@@ -213,7 +208,7 @@ class TestComplexPositions:
 
         # Set up discovered check position
         # White bishop on a1, white knight blocking, black king on h8
-        game.board = chess.Board("7k/8/8/8/8/8/1N6/B7 w - - 0 1")
+        game.board = board_factory("7k/8/8/8/8/8/1N6/B7 w - - 0 1")
 
         # Move knight to discover check
         game.board.push_san("Nd3")
@@ -223,8 +218,9 @@ class TestComplexPositions:
 
         # Black must respond to check
         legal_moves = list(game.board.legal_moves)
-        # All legal moves should address the check
+        # All legal moves should address the check; each is tried and undone
+        # in place rather than on a copy of the board
         for move in legal_moves:
-            test_board = game.board.copy()
-            test_board.push(move)
-            assert not test_board.is_check()
+            game.board.push(move)
+            assert not game.board.is_check()
+            game.board.pop()
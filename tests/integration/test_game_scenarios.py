@@ -1,15 +1,39 @@
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import chess
 import pytest
 
 from llm_chess_arena.game import Game
 from llm_chess_arena.player.random_player import RandomPlayer
-from tests.conftest import (
+from tests.helpers import (
     FailingPlayer,
     RecordingPlayer,
     setup_game_from_fen,
 )
 
 
+def _play_seeded_game(seed_pair, move_limit=300):
+    """Play one random game; module-level so worker processes can unpickle it.
+
+    Args:
+        seed_pair: RNG seeds for the white and black players.
+        move_limit: Maximum number of half-moves before stopping.
+
+    Returns:
+        The game outcome, or None if it hit the move limit.
+    """
+    white_seed, black_seed = seed_pair
+    white_player = RandomPlayer(name="White", color="white", seed=white_seed)
+    black_player = RandomPlayer(name="Black", color="black", seed=black_seed)
+
+    game = Game(white_player, black_player)
+    game.play(max_num_moves=move_limit)
+
+    return game.outcome if game.finished else None
+
+
 class TestRandomVsRandom:
     def test_game__should_terminate__before_move_limit(self, game):
         max_moves_before_timeout = 200
@@ -28,24 +52,21 @@ class TestRandomVsRandom:
     def test_games__should_produce_varied_outcomes__when_seeds_differ(
         self,
     ):
-        outcomes = []
         num_games = 5
         move_limit = 200
+        seed_pairs = [(game_idx, game_idx + 100) for game_idx in range(num_games)]
+
+        with ProcessPoolExecutor(
+            max_workers=min(len(seed_pairs), os.cpu_count() or 1)
+        ) as executor:
+            outcomes = executor.map(
+                functools.partial(_play_seeded_game, move_limit=move_limit),
+                seed_pairs,
+            )
+            unique_outcomes = {
+                outcome.result() if outcome else "unfinished" for outcome in outcomes
+            }
 
-        for game_idx in range(num_games):
-            white_seed = game_idx
-            black_seed = game_idx + 100
-
-            white_player = RandomPlayer(name="White", color="white", seed=white_seed)
-            black_player = RandomPlayer(name="Black", color="black", seed=black_seed)
-
-            game = Game(white_player, black_player)
-            game.play(max_num_moves=move_limit)
-
-            outcome = game.outcome.result() if game.finished else "unfinished"
-            outcomes.append(outcome)
-
-        unique_outcomes = set(outcomes)
         assert (
             len(unique_outcomes) > 1
         ), f"Expected varied outcomes, got only: {unique_outcomes}"
@@ -54,22 +75,17 @@ class TestRandomVsRandom:
     def test_games__should_achieve_checkmate__when_playing_many_games(
         self,
     ):
-        termination_types = set()
         num_games = 20
-        move_limit = 300
-
-        for game_idx in range(num_games):
-            white_seed = game_idx * 2
-            black_seed = game_idx * 2 + 1
+        seed_pairs = [(game_idx * 2, game_idx * 2 + 1) for game_idx in range(num_games)]
 
-            white_player = RandomPlayer(name="White", color="white", seed=white_seed)
-            black_player = RandomPlayer(name="Black", color="black", seed=black_seed)
-
-            game = Game(white_player, black_player)
-            game.play(max_num_moves=move_limit)
-
-            if game.finished and game.outcome:
-                termination_types.add(game.outcome.termination)
+        # Games share no state, so they are played in parallel processes
+        with ProcessPoolExecutor(
+            max_workers=min(len(seed_pairs), os.cpu_count() or 1)
+        ) as executor:
+            termination_types = {
+                outcome.termination if outcome else None
+                for outcome in executor.map(_play_seeded_game, seed_pairs)
+            }
 
         assert (
             chess.Termination.CHECKMATE in termination_types
@@ -82,10 +98,19 @@ class TestGameWithCustomBoard:
     ):
         game = Game(white_player, black_player)
 
-        spanish_opening_moves = ["e4", "e5", "Nf3", "Nc6", "Bb5", "a6", "Ba4", "Nf6"]
-
-        for move_san in spanish_opening_moves:
-            game.board.push_san(move_san)
+        spanish_opening_moves = [
+            "e2e4",
+            "e7e5",
+            "g1f3",
+            "b8c6",
+            "f1b5",
+            "a7a6",
+            "b5a4",
+            "g8f6",
+        ]
+
+        for move_uci in spanish_opening_moves:
+            game.board.push_uci(move_uci)
 
         moves_after_setup = len(game.board.move_stack)
         assert moves_after_setup == 8
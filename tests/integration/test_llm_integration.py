@@ -1,3 +1,4 @@
+import asyncio
 import os
 import pytest
 import chess
@@ -23,39 +24,52 @@ def get_first_available_llm_model():
         pytest.skip("No API keys available")
 
 
-@pytest.mark.parametrize(
-    "llm_model_name,required_env_var",
-    [
-        ("gpt-3.5-turbo", "OPENAI_API_KEY"),
-        ("claude-3-haiku-20240307", "ANTHROPIC_API_KEY"),
-        ("gemini/gemini-2.0-flash-exp", "GOOGLE_API_KEY"),
-    ],
-)
-def test_llm_player_generates_legal_opening_move_from_starting_position(
-    llm_model_name, required_env_var
-):
-    if not os.getenv(required_env_var):
-        pytest.skip(f"{required_env_var} not set")
+# (model, API key environment variable) for every provider under test
+LLM_PROVIDERS = [
+    ("gpt-3.5-turbo", "OPENAI_API_KEY"),
+    ("claude-3-haiku-20240307", "ANTHROPIC_API_KEY"),
+    ("gemini/gemini-2.0-flash-exp", "GOOGLE_API_KEY"),
+]
+
+
+def test_llm_players_generate_legal_opening_moves_from_starting_position():
+    available_llm_models = [
+        llm_model_name
+        for llm_model_name, required_env_var in LLM_PROVIDERS
+        if os.getenv(required_env_var)
+    ]
+    if not available_llm_models:
+        pytest.skip("No API keys available")
 
-    deterministic_llm_connector = LLMConnector(
-        model=llm_model_name,
-        temperature=0.0,
-        max_tokens=1000,
-        timeout=10.0,
-    )
     game_arena_handler = GameArenaLLMMoveHandler()
-    white_llm_player = LLMPlayer(
-        connector=deterministic_llm_connector, handler=game_arena_handler, color="white"
-    )
+    white_llm_players = [
+        LLMPlayer(
+            connector=LLMConnector(
+                model=llm_model_name,
+                temperature=0.0,
+                max_tokens=1000,
+                timeout=10.0,
+            ),
+            handler=game_arena_handler,
+            color="white",
+        )
+        for llm_model_name in available_llm_models
+    ]
+
+    async def ask_all_players():
+        # Providers are queried concurrently, so the test waits for the
+        # slowest round trip rather than the sum of all of them
+        return await asyncio.gather(
+            *(asyncio.to_thread(player, chess.Board()) for player in white_llm_players)
+        )
 
     starting_position_board = chess.Board()
-    player_decision = white_llm_player(starting_position_board)
-
-    assert player_decision.action == "move"
-    generated_chess_move = chess.Move.from_uci(player_decision.attempted_move)
-    assert generated_chess_move in starting_position_board.legal_moves
-    assert generated_chess_move.from_square in range(64)
-    assert generated_chess_move.to_square in range(64)
+    for player, player_decision in zip(
+        white_llm_players, asyncio.run(ask_all_players())
+    ):
+        assert player_decision.action == "move", f"{player} did not move"
+        generated_chess_move = chess.Move.from_uci(player_decision.attempted_move)
+        assert generated_chess_move in starting_position_board.legal_moves
 
 
 def test_llm_retry_mechanism_recovers_from_illegal_move_attempts():
@@ -16,6 +16,7 @@ CASSETTE_DIR.mkdir(exist_ok=True)
 vcr_config = vcr.VCR(
     cassette_library_dir=str(CASSETTE_DIR),
     record_mode="once",  # Record if cassette doesn't exist, replay otherwise
+    serializer="json",  # Parses far faster than the default YAML on replay
     match_on=["method", "scheme", "host", "port", "path", "query"],
     filter_headers=[
         "authorization",
@@ -35,21 +36,32 @@ vcr_config = vcr.VCR(
 )
 
 
+@pytest.fixture(scope="session")
+def gpt4o_mini_connector():
+    """Deterministic gpt-4o-mini connector shared by the VCR tests."""
+    return LLMConnector(model="gpt-4o-mini", temperature=0.0)
+
+
+@pytest.fixture(scope="session")
+def move_handler():
+    """Stateless move handler shared by the VCR tests."""
+    return GameArenaLLMMoveHandler()
+
+
 class TestLLMIntegrationVCR:
     """Reproducible LLM integration tests using VCR."""
 
-    @vcr_config.use_cassette("openai_single_move.yaml")
-    def test_openai_single_move__with_vcr__then_reproducible(self):
+    @vcr_config.use_cassette("openai_single_move.json")
+    def test_openai_single_move__with_vcr__then_reproducible(self, move_handler):
         """Test OpenAI move generation with recorded response."""
         connector = LLMConnector(
             model="gpt-4o-mini",
             temperature=0.0,  # Deterministic
             max_tokens=500,
         )
-        handler = GameArenaLLMMoveHandler()
         player = LLMPlayer(
             connector=connector,
-            handler=handler,
+            handler=move_handler,
             color="white",
             name="OpenAI-VCR",
             max_move_retries=3,
@@ -63,16 +75,14 @@ class TestLLMIntegrationVCR:
         assert decision.action == "move"
         assert decision.attempted_move in ["e2e4", "d2d4", "g1f3", "b1c3"]
 
-    @vcr_config.use_cassette("llm_retry_illegal_move.yaml")
-    def test_llm_retry_on_illegal__with_vcr__then_recovers(self):
+    @vcr_config.use_cassette("llm_retry_illegal_move.json")
+    def test_llm_retry_on_illegal__with_vcr__then_recovers(
+        self, gpt4o_mini_connector, move_handler
+    ):
         """Test LLM retry logic with recorded responses."""
-        # Create a mock connector that returns illegal move first
-        connector = LLMConnector(model="gpt-4o-mini", temperature=0.0)
-        handler = GameArenaLLMMoveHandler()
-
         player = LLMPlayer(
-            connector=connector,
-            handler=handler,
+            connector=gpt4o_mini_connector,
+            handler=move_handler,
             color="white",
             max_move_retries=5,  # Increased retries to handle stubborn models
             num_votes=1,
@@ -89,18 +99,17 @@ class TestLLMIntegrationVCR:
         move = chess.Move.from_uci(decision.attempted_move)
         assert move in board.legal_moves
 
-    @vcr_config.use_cassette("llm_majority_voting.yaml")
-    def test_llm_majority_voting__with_vcr__then_deterministic(self):
+    @vcr_config.use_cassette("llm_majority_voting.json")
+    def test_llm_majority_voting__with_vcr__then_deterministic(self, move_handler):
         """Test majority voting with recorded responses."""
         connector = LLMConnector(
             model="gpt-4o-mini",
             temperature=0.7,  # Higher temp for variety
         )
-        handler = GameArenaLLMMoveHandler()
 
         player = LLMPlayer(
             connector=connector,
-            handler=handler,
+            handler=move_handler,
             color="white",
             num_votes=3,  # Request 3 samples
         )
@@ -112,15 +121,17 @@ class TestLLMIntegrationVCR:
         assert decision.action == "move"
         assert decision.attempted_move is not None
 
-    @vcr_config.use_cassette("llm_complex_position.yaml")
-    def test_llm_complex_position__with_vcr__then_finds_good_move(self):
+    @vcr_config.use_cassette("llm_complex_position.json")
+    def test_llm_complex_position__with_vcr__then_finds_good_move(
+        self, board_factory, gpt4o_mini_connector, move_handler
+    ):
         """Test LLM on complex middlegame position with recording."""
-        connector = LLMConnector(model="gpt-4o-mini", temperature=0.0)
-        handler = GameArenaLLMMoveHandler()
-        player = LLMPlayer(connector=connector, handler=handler, color="white")
+        player = LLMPlayer(
+            connector=gpt4o_mini_connector, handler=move_handler, color="white"
+        )
 
         # Complex tactical position
-        board = chess.Board(
+        board = board_factory(
             "r1bqk2r/pp2bppp/2n1pn2/3p4/2PP4/2N1PN2/PP2BPPP/R1BQKR2 w Qkq - 2 9"
         )
 
@@ -131,15 +142,17 @@ class TestLLMIntegrationVCR:
         move = chess.Move.from_uci(decision.attempted_move)
         assert move in board.legal_moves
 
-    @vcr_config.use_cassette("llm_endgame_position.yaml")
-    def test_llm_endgame__with_vcr__then_handles_correctly(self):
+    @vcr_config.use_cassette("llm_endgame_position.json")
+    def test_llm_endgame__with_vcr__then_handles_correctly(
+        self, board_factory, gpt4o_mini_connector, move_handler
+    ):
         """Test LLM in endgame position with recording."""
-        connector = LLMConnector(model="gpt-4o-mini", temperature=0.0)
-        handler = GameArenaLLMMoveHandler()
-        player = LLMPlayer(connector=connector, handler=handler, color="white")
+        player = LLMPlayer(
+            connector=gpt4o_mini_connector, handler=move_handler, color="white"
+        )
 
         # King and pawn endgame
-        board = chess.Board("8/8/8/3k4/8/3K4/3P4/8 w - - 0 1")
+        board = board_factory("8/8/8/3k4/8/3K4/3P4/8 w - - 0 1")
 
         decision = player(board)
 
@@ -150,15 +163,14 @@ class TestLLMIntegrationVCR:
 class TestLLMErrorHandlingVCR:
     """Test error scenarios with VCR."""
 
-    @vcr_config.use_cassette("llm_timeout_simulation.yaml")
-    def test_llm_timeout__with_vcr__then_handles_gracefully(self):
+    @vcr_config.use_cassette("llm_timeout_simulation.json")
+    def test_llm_timeout__with_vcr__then_handles_gracefully(self, move_handler):
         """Test timeout handling with recorded response."""
         connector = LLMConnector(
             model="gpt-4o-mini",
             timeout=1,  # Very short timeout
         )
-        handler = GameArenaLLMMoveHandler()
-        player = LLMPlayer(connector=connector, handler=handler, color="white")
+        player = LLMPlayer(connector=connector, handler=move_handler, color="white")
 
         board = chess.Board()
 
@@ -172,15 +184,14 @@ class TestLLMErrorHandlingVCR:
             # If it fails, verify it's a timeout-related error
             assert "timeout" in str(e).lower() or "time" in str(e).lower()
 
-    @vcr_config.use_cassette("llm_malformed_response.yaml")
-    def test_llm_malformed_response__with_vcr__then_retries(self):
+    @vcr_config.use_cassette("llm_malformed_response.json")
+    def test_llm_malformed_response__with_vcr__then_retries(self, move_handler):
         """Test handling of malformed LLM responses."""
         # This would need a cassette with actual malformed responses
         # For now, we test the retry mechanism
         connector = LLMConnector(model="gpt-4o-mini", temperature=1.0)
-        handler = GameArenaLLMMoveHandler()
         player = LLMPlayer(
-            connector=connector, handler=handler, color="white", max_move_retries=3
+            connector=connector, handler=move_handler, color="white", max_move_retries=3
         )
 
         board = chess.Board()
@@ -194,16 +205,16 @@ class TestLLMErrorHandlingVCR:
 @pytest.fixture
 def vcr_cassette_name(request):
     """Generate cassette name from test name."""
-    return f"{request.node.name}.yaml"
+    return f"{request.node.name}.json"
 
 
 @pytest.fixture
-def llm_player_vcr(vcr_cassette_name):
+def llm_player_vcr(vcr_cassette_name, gpt4o_mini_connector, move_handler):
     """Create LLM player with VCR recording."""
     with vcr_config.use_cassette(vcr_cassette_name):
-        connector = LLMConnector(model="gpt-4o-mini", temperature=0.0)
-        handler = GameArenaLLMMoveHandler()
-        player = LLMPlayer(connector=connector, handler=handler, color="white")
+        player = LLMPlayer(
+            connector=gpt4o_mini_connector, handler=move_handler, color="white"
+        )
         yield player
 
 
@@ -227,15 +238,19 @@ class TestLLMGamesVCR:
         # Game should progress without errors
         assert len(game.board.move_stack) >= 1
 
-    @vcr_config.use_cassette("llm_vs_llm_short.yaml")
-    def test_llm_vs_llm__with_vcr__then_plays_moves(self):
+    @vcr_config.use_cassette("llm_vs_llm_short.json")
+    def test_llm_vs_llm__with_vcr__then_plays_moves(
+        self, gpt4o_mini_connector, move_handler
+    ):
         """Test LLM vs LLM with recording."""
-        connector1 = LLMConnector(model="gpt-4o-mini", temperature=0.0)
-        connector2 = LLMConnector(model="gpt-4o-mini", temperature=0.3)
-        handler = GameArenaLLMMoveHandler()
+        black_connector = LLMConnector(model="gpt-4o-mini", temperature=0.3)
 
-        white = LLMPlayer(connector=connector1, handler=handler, color="white")
-        black = LLMPlayer(connector=connector2, handler=handler, color="black")
+        white = LLMPlayer(
+            connector=gpt4o_mini_connector, handler=move_handler, color="white"
+        )
+        black = LLMPlayer(
+            connector=black_connector, handler=move_handler, color="black"
+        )
 
         from llm_chess_arena.game import Game
 
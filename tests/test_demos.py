@@ -1,3 +1,4 @@
+import importlib.util
 import subprocess
 import sys
 from pathlib import Path
@@ -7,8 +8,30 @@ import pytest
 DEMO_DIR = Path(__file__).parent.parent / "demo"
 
 
+def load_demo_main(script_name):
+    """Import a demo script by path and return its main() function."""
+    script_path = DEMO_DIR / script_name
+    spec = importlib.util.spec_from_file_location(
+        f"demo_{script_path.stem}", script_path
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.main
+
+
 @pytest.mark.smoke
-def test_demo__should_complete_successfully__when_running_random_game():
+def test_demo__should_complete_successfully__when_running_random_game(capsys):
+    load_demo_main("run_game.py")()
+
+    output = capsys.readouterr().out
+    assert "Result:" in output
+    assert "Termination:" in output
+    assert "Total moves:" in output
+
+
+@pytest.mark.smoke
+@pytest.mark.slow
+def test_demo__should_run_as_script__when_launched_in_fresh_interpreter():
     script_path = DEMO_DIR / "run_game.py"
 
     result = subprocess.run(
@@ -25,26 +48,12 @@ def test_demo__should_complete_successfully__when_running_random_game():
     )
 
     assert "Result:" in result.stdout
-    assert "Termination:" in result.stdout
-    assert "Total moves:" in result.stdout
 
 
 @pytest.mark.smoke
 @pytest.mark.requires_stockfish
-def test_demo__should_complete_successfully__when_running_stockfish_game():
-    script_path = DEMO_DIR / "run_stockfish_game.py"
-
-    result = subprocess.run(
-        [sys.executable, str(script_path)],
-        capture_output=True,
-        text=True,
-        timeout=30,
-        cwd=script_path.parent.parent,
-    )
-
-    assert result.returncode == 0, (
-        f"Stockfish demo failed with exit code {result.returncode}.\n"
-        f"STDERR:\n{result.stderr}"
-    )
+def test_demo__should_complete_successfully__when_running_stockfish_game(capsys):
+    load_demo_main("run_stockfish_game.py")()
 
-    assert "Result:" in result.stdout or "Winner:" in result.stdout
+    output = capsys.readouterr().out
+    assert "Result:" in output or "Winner:" in output
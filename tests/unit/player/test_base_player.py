@@ -1,11 +1,15 @@
 """Unit tests for BasePlayer abstract class and its concrete methods."""
 
+import re
+
 import pytest
 import chess
 
 from llm_chess_arena.player.base_player import BasePlayer
 from llm_chess_arena.types import PlayerDecision, PlayerDecisionContext
 
+EMPTY_LEGAL_MOVES_PATTERN = re.compile(r"legal_moves_in_uci.*cannot be empty")
+
 
 class ConcretePlayer(BasePlayer):
     """Minimal concrete implementation for testing BasePlayer."""
@@ -48,9 +52,9 @@ class TestBasePlayerExtractContext:
         board = chess.Board()
 
         # Make some moves
-        board.push_san("e4")
-        board.push_san("e5")
-        board.push_san("Nf3")
+        board.push_uci("e2e4")
+        board.push_uci("e7e5")
+        board.push_uci("g1f3")
 
         context = player._extract_context(board)
 
@@ -59,39 +63,39 @@ class TestBasePlayerExtractContext:
         assert len(context.legal_moves_in_uci) > 0
 
     def test_extract_context__given_checkmate_position__when_called__then_raises_validation_error(
-        self,
+        self, board_factory
     ):
         """Test that context extraction raises error when player is checkmated."""
         player = ConcretePlayer(name="Test", color="black")
         # Fool's mate position (black is checkmated)
-        board = chess.Board(
+        board = board_factory(
             "rnbqkbnr/pppp1ppp/8/4p3/6P1/5P2/PPPPP2P/RNBQKBNR b KQkq - 0 2"
         )
         board.push_san("Qh4#")
 
         # Should raise validation error as legal_moves_in_uci cannot be empty
-        with pytest.raises(ValueError, match="legal_moves_in_uci.*cannot be empty"):
+        with pytest.raises(ValueError, match=EMPTY_LEGAL_MOVES_PATTERN):
             player._extract_context(board)
 
     def test_extract_context__given_stalemate_position__when_called__then_raises_validation_error(
-        self,
+        self, board_factory
     ):
         """Test that context extraction raises error in stalemate position."""
         player = ConcretePlayer(name="Test", color="black")
         # Stalemate position
-        board = chess.Board("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1")
+        board = board_factory("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1")
 
         # Should raise validation error as legal_moves_in_uci cannot be empty
-        with pytest.raises(ValueError, match="legal_moves_in_uci.*cannot be empty"):
+        with pytest.raises(ValueError, match=EMPTY_LEGAL_MOVES_PATTERN):
             player._extract_context(board)
 
     def test_extract_context__given_promotion_moves__when_called__then_includes_all_promotions(
-        self,
+        self, board_factory
     ):
         """Test that pawn promotion moves are included in legal moves."""
         player = ConcretePlayer(name="Test", color="white")
         # White pawn ready to promote
-        board = chess.Board("8/P7/8/8/8/8/8/8 w - - 0 1")
+        board = board_factory("8/P7/8/8/8/8/8/8 w - - 0 1")
 
         context = player._extract_context(board)
 
@@ -102,12 +106,12 @@ class TestBasePlayerExtractContext:
         assert "a7a8n" in context.legal_moves_in_uci  # Knight
 
     def test_extract_context__given_en_passant__when_available__then_included_in_moves(
-        self,
+        self, board_factory
     ):
         """Test that en passant captures are included in legal moves."""
         player = ConcretePlayer(name="Test", color="white")
         # Position where en passant is possible
-        board = chess.Board(
+        board = board_factory(
             "rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3"
         )
 
@@ -117,12 +121,12 @@ class TestBasePlayerExtractContext:
         assert "e5f6" in context.legal_moves_in_uci
 
     def test_extract_context__given_castling_rights__when_available__then_included(
-        self,
+        self, board_factory
     ):
         """Test that castling moves are included when available."""
         player = ConcretePlayer(name="Test", color="white")
         # Position with castling available
-        board = chess.Board("r3k2r/pppppppp/8/8/8/8/PPPPPPPP/R3K2R w KQkq - 0 1")
+        board = board_factory("r3k2r/pppppppp/8/8/8/8/PPPPPPPP/R3K2R w KQkq - 0 1")
 
         context = player._extract_context(board)
 
@@ -131,12 +135,12 @@ class TestBasePlayerExtractContext:
         assert "e1c1" in context.legal_moves_in_uci  # Queenside
 
     def test_extract_context__given_complex_position__when_called__then_correct_legal_moves(
-        self,
+        self, board_factory
     ):
         """Test context extraction from a complex middlegame position."""
         player = ConcretePlayer(name="Test", color="white")
         # Complex position from actual game
-        board = chess.Board(
+        board = board_factory(
             "r1bqk2r/pp1nbppp/2p1pn2/3p4/2PP4/2N1PN2/PP2BPPP/R1BQKR2 w Qkq - 0 8"
         )
 
@@ -173,19 +177,19 @@ class TestBasePlayerCallMethod:
         )
 
         # Should raise due to empty legal moves validation
-        with pytest.raises(ValueError, match="legal_moves_in_uci.*cannot be empty"):
+        with pytest.raises(ValueError, match=EMPTY_LEGAL_MOVES_PATTERN):
             player(board)
 
     def test_call__preserves_board_state__when_invoked__then_board_unchanged(self):
         """Test that calling player doesn't modify the board state."""
         player = ConcretePlayer(name="Test", color="white")
         board = chess.Board()
-        initial_fen = board.fen()
+        initial_state = (board._transposition_key(), tuple(board.move_stack))
 
         player(board)
 
         # Board should be unchanged
-        assert board.fen() == initial_fen
+        assert (board._transposition_key(), tuple(board.move_stack)) == initial_state
         assert len(board.move_stack) == 0
 
 
@@ -0,0 +1,109 @@
+import sys
+
+import pytest
+
+from llm_chess_arena.player.llm.llm_cache import InMemoryLLMCache, RedisLLMCache
+
+
+class FakeRedis:
+    """Minimal stand-in for the redis client calls RedisLLMCache makes."""
+
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value):
+        self.values[key] = value.encode()
+
+    def setex(self, key, ttl, value):
+        self.set(key, value)
+        self.ttls[key] = ttl
+
+    def scan_iter(self, match):
+        prefix = match.rstrip("*")
+        return [key for key in self.values if key.startswith(prefix)]
+
+    def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+
+class TestInMemoryLLMCache:
+    def test_lookup__returns_stored_contents_for_same_prompt_and_llm_string(self):
+        cache = InMemoryLLMCache()
+
+        cache.update("prompt", "gpt-4", ["Final Answer: e4"])
+
+        assert cache.lookup("prompt", "gpt-4") == ["Final Answer: e4"]
+        assert cache.lookup("prompt", "claude-3-haiku") is None
+        assert cache.lookup("other prompt", "gpt-4") is None
+
+    def test_lookup__returns_copy_that_callers_cannot_mutate(self):
+        cache = InMemoryLLMCache()
+        cache.update("prompt", "gpt-4", ["Final Answer: e4"])
+
+        cache.lookup("prompt", "gpt-4").append("Final Answer: d4")
+
+        assert cache.lookup("prompt", "gpt-4") == ["Final Answer: e4"]
+
+    def test_update__clears_cache_once_max_size_reached(self):
+        cache = InMemoryLLMCache(max_size=2)
+
+        cache.update("first", "gpt-4", ["e4"])
+        cache.update("second", "gpt-4", ["d4"])
+        cache.update("third", "gpt-4", ["c4"])
+
+        assert cache.lookup("first", "gpt-4") is None
+        assert cache.lookup("third", "gpt-4") == ["c4"]
+
+    def test_clear__drops_every_response(self):
+        cache = InMemoryLLMCache()
+        cache.update("prompt", "gpt-4", ["e4"])
+
+        cache.clear()
+
+        assert cache.lookup("prompt", "gpt-4") is None
+
+
+class TestRedisLLMCache:
+    def test_update__stores_json_under_prefixed_key_with_ttl(self):
+        client = FakeRedis()
+        cache = RedisLLMCache(client=client, ttl_seconds=60, key_prefix="test:")
+
+        cache.update("prompt", "gpt-4", ["Final Answer: e4"])
+
+        [key] = client.values
+        assert key.startswith("test:")
+        assert client.ttls[key] == 60
+        assert cache.lookup("prompt", "gpt-4") == ["Final Answer: e4"]
+        assert cache.lookup("prompt", "claude-3-haiku") is None
+
+    def test_update__without_ttl_stores_key_without_expiry(self):
+        client = FakeRedis()
+        cache = RedisLLMCache(client=client, ttl_seconds=None)
+
+        cache.update("prompt", "gpt-4", ["e4"])
+
+        assert client.ttls == {}
+        assert cache.lookup("prompt", "gpt-4") == ["e4"]
+
+    def test_clear__only_deletes_keys_under_own_prefix(self):
+        client = FakeRedis()
+        client.values["unrelated"] = b"keep"
+        cache = RedisLLMCache(client=client)
+        cache.update("prompt", "gpt-4", ["e4"])
+
+        cache.clear()
+
+        assert client.values == {"unrelated": b"keep"}
+
+    def test_init__without_client_or_redis_package_raises_import_error(
+        self, monkeypatch
+    ):
+        monkeypatch.setitem(sys.modules, "redis", None)
+
+        with pytest.raises(ImportError, match=r"llm_chess_arena\[redis\]"):
+            RedisLLMCache()
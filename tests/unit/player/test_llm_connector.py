@@ -1,61 +1,129 @@
+import asyncio
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import patch, Mock
+from unittest.mock import AsyncMock, Mock, patch
 import litellm
 
-from llm_chess_arena.player.llm.llm_connector import LLMConnector
+from llm_chess_arena.player.llm.llm_cache import BaseLLMCache
+from llm_chess_arena.player.llm.llm_connector import LLMConnector, is_retryable_error
+from llm_chess_arena.player.llm.llm_move_handler import GameArenaLLMMoveHandler
 from llm_chess_arena.config import load_env
 
-load_env()
 
+@pytest.fixture(scope="session")
+def live_env():
+    """Load API keys from the .env file, only for tests that call providers."""
+    load_env()
 
-class TestLLMConnectorWithMockResponse:
-    def test_query_returns_mocked_llm_response_content(self):
-        with patch("litellm.completion") as mock_completion:
-            mock_completion.return_value = Mock(
-                choices=[Mock(message=Mock(content="Final Answer: e4"))]
-            )
 
-            connector = LLMConnector(
-                model="gpt-3.5-turbo",
-                temperature=0.7,
-                max_tokens=150,
-            )
+@pytest.fixture
+def backoff_sleep():
+    """Capture backoff sleeps instead of waiting on them."""
+    with patch("time.sleep") as mock_sleep:
+        yield mock_sleep
 
-            response = connector.query("What's your move?")
 
-            assert response == ["Final Answer: e4"]
-            mock_completion.assert_called_once()
-            call_args = mock_completion.call_args
+@pytest.fixture
+def async_backoff_sleep():
+    """Capture async backoff sleeps instead of waiting on them."""
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        yield mock_sleep
 
-            assert call_args.kwargs["model"] == "gpt-3.5-turbo"
-            assert call_args.kwargs["messages"] == [
-                {"role": "user", "content": "What's your move?"}
-            ]
-            assert call_args.kwargs["temperature"] == 0.7
-            assert call_args.kwargs["max_tokens"] == 150
 
-    def test_query_includes_system_prompt_in_message_list(self):
-        with patch("litellm.completion") as mock_completion:
-            mock_completion.return_value = Mock(
-                choices=[Mock(message=Mock(content="Response"))]
-            )
+@pytest.fixture
+def fake_completion(monkeypatch):
+    """Replace litellm.completion with a recorder returning one fixed response.
+
+    Returns:
+        List that receives the keyword arguments of every completion call.
+    """
+    response = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="Final Answer: e4"))]
+    )
+    calls = []
+
+    def completion(**kwargs):
+        calls.append(kwargs)
+        return response
+
+    monkeypatch.setattr(litellm, "completion", completion)
+    return calls
 
-            connector = LLMConnector(model="claude-3-haiku")
 
-            connector.query("User prompt", system_prompt="You are a chess expert")
+@pytest.fixture
+def isolated_http_client(monkeypatch):
+    """Start without a shared HTTP client and close the one a test creates."""
+    monkeypatch.setattr(litellm, "client_session", None)
+    monkeypatch.setattr(LLMConnector, "_shared_http_client", None)
+    yield
+    LLMConnector._close_shared_http_client()
 
-            call_args = mock_completion.call_args
-            messages = call_args.kwargs["messages"]
 
-            assert len(messages) == 2
-            assert messages[0] == {
-                "role": "system",
-                "content": "You are a chess expert",
-            }
-            assert messages[1] == {"role": "user", "content": "User prompt"}
+class TestLLMConnectorWithMockResponse:
+    def test_query_returns_mocked_llm_response_content(self, fake_completion):
+        connector = LLMConnector(
+            model="gpt-3.5-turbo",
+            temperature=0.7,
+            max_tokens=150,
+        )
+
+        response = connector.query("What's your move?")
+
+        assert response == ["Final Answer: e4"]
+        [call_kwargs] = fake_completion
+
+        assert call_kwargs["model"] == "gpt-3.5-turbo"
+        assert call_kwargs["messages"] == [
+            {"role": "user", "content": "What's your move?"}
+        ]
+        assert call_kwargs["temperature"] == 0.7
+        assert call_kwargs["max_tokens"] == 150
+
+    def test_query_includes_system_prompt_in_message_list(self, fake_completion):
+        connector = LLMConnector(model="gpt-4o-mini")
 
-    def test_query_converts_litellm_timeout_to_standard_timeout_error(self):
+        connector.query("User prompt", system_prompt="You are a chess expert")
+
+        messages = fake_completion[-1]["messages"]
+
+        assert len(messages) == 2
+        assert messages[0] == {
+            "role": "system",
+            "content": "You are a chess expert",
+        }
+        assert messages[1] == {"role": "user", "content": "User prompt"}
+
+    @pytest.mark.parametrize(
+        "model", ["claude-3-haiku", "anthropic/claude-3-5-sonnet-20241022"]
+    )
+    def test_query_marks_anthropic_system_prompt_for_prompt_caching(
+        self, fake_completion, model
+    ):
+        connector = LLMConnector(model=model)
+
+        connector.query("User prompt", system_prompt="You are a chess expert")
+
+        messages = fake_completion[-1]["messages"]
+
+        assert messages[0] == {
+            "role": "system",
+            "content": [
+                {
+                    "type": "text",
+                    "text": "You are a chess expert",
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+        }
+        assert messages[1] == {"role": "user", "content": "User prompt"}
+
+    def test_query_converts_litellm_timeout_to_standard_timeout_error(
+        self, backoff_sleep
+    ):
         with patch("litellm.completion") as mock_completion:
             mock_completion.side_effect = litellm.Timeout(
                 message="Request timed out", model="gpt-4", llm_provider="openai"
@@ -70,6 +138,44 @@ class TestLLMConnectorWithMockResponse:
             with pytest.raises(TimeoutError, match="Request timed out after 5.0s"):
                 connector.query("Test prompt")
 
+    def test_total_deadline_aborts_retry_loop(self, monkeypatch):
+        clock = {"now": 0.0}
+        call_timeouts = []
+
+        def rate_limited_completion(**kwargs):
+            call_timeouts.append(kwargs["timeout"])
+            clock["now"] += 3.0
+            raise litellm.RateLimitError(
+                message="Too many requests", model="gpt-4", llm_provider="openai"
+            )
+
+        def advance_clock(seconds):
+            clock["now"] += seconds
+
+        monkeypatch.setattr("time.monotonic", lambda: clock["now"])
+        monkeypatch.setattr("time.sleep", advance_clock)
+        monkeypatch.setattr(litellm, "completion", rate_limited_completion)
+        connector = LLMConnector(
+            model="gpt-4", timeout=30.0, max_retries=10, deadline=8.0
+        )
+
+        with pytest.raises(ConnectionError, match="temporarily unavailable"):
+            connector.query("Test prompt")
+
+        # Attempt 2 ends at 7-8s, so the next 2-3s backoff would cross 8s
+        assert len(call_timeouts) == 2
+        assert call_timeouts[0] == 8.0
+        assert 3.0 <= call_timeouts[1] <= 4.0
+
+    def test_query_raises_connection_error_when_response_lacks_message(self):
+        with patch("litellm.completion") as mock_completion:
+            mock_completion.return_value = Mock(choices=[Mock(spec=[])])
+
+            connector = LLMConnector(model="gpt-4")
+
+            with pytest.raises(ConnectionError, match="missing content message"):
+                connector.query("Test prompt")
+
     def test_query_wraps_unexpected_exceptions_as_connection_error(self):
         with patch("litellm.completion") as mock_completion:
             mock_completion.side_effect = Exception("API error")
@@ -83,22 +189,508 @@ class TestLLMConnectorWithMockResponse:
                 connector.query("Test prompt")
 
 
+class CannedCache(BaseLLMCache):
+    """Cache that answers every lookup and records what it was given."""
+
+    def __init__(self, contents):
+        self.contents = contents
+        self.lookups = []
+        self.updates = []
+
+    def lookup(self, prompt, llm_string):
+        self.lookups.append((prompt, llm_string))
+        return self.contents
+
+    def update(self, prompt, llm_string, contents):
+        self.updates.append((prompt, llm_string, contents))
+
+    def clear(self):
+        self.contents = None
+
+
+class TestLLMConnectorResponseCache:
+    def test_query_answers_from_injected_cache_without_calling_litellm(
+        self, fake_completion
+    ):
+        cache = CannedCache(["Final Answer: d4"])
+        connector = LLMConnector(model="gpt-4", temperature=0.0, cache=cache)
+
+        assert connector.query("Your move?") == ["Final Answer: d4"]
+
+        assert fake_completion == []
+        [(prompt, llm_string)] = cache.lookups
+        assert "Your move?" in prompt
+        assert "gpt-4" in llm_string
+
+    def test_query_stores_provider_response_in_injected_cache_on_miss(
+        self, fake_completion
+    ):
+        cache = CannedCache(None)
+        connector = LLMConnector(model="gpt-4", temperature=0.0, cache=cache)
+
+        connector.query("Your move?")
+
+        [(prompt, llm_string, contents)] = cache.updates
+        assert (prompt, llm_string) == cache.lookups[0]
+        assert contents == ["Final Answer: e4"]
+
+    def test_query_serves_identical_prompt_from_cache_without_hitting_litellm(
+        self, fake_completion
+    ):
+        connector = LLMConnector(model="gpt-4", temperature=0.0)
+
+        first_response = connector.query("x")
+        second_response = connector.query("x")
+
+        assert first_response == second_response == ["Final Answer: e4"]
+        assert len(fake_completion) == 1
+
+    def test_query_cache_distinguishes_prompts_and_sample_counts(self, fake_completion):
+        connector = LLMConnector(model="gpt-4", temperature=0.0)
+
+        connector.query("x")
+        connector.query("y")
+        connector.query("x", n=2)
+        connector.query("x", system_prompt="Play chess")
+
+        assert len(fake_completion) == 4
+
+    def test_query_does_not_cache_sampled_responses(self, fake_completion):
+        connector = LLMConnector(model="gpt-4", temperature=0.7)
+
+        connector.query("x")
+        connector.query("x")
+
+        assert len(fake_completion) == 2
+
+    def test_cache_clear_sends_next_identical_prompt_to_litellm(self, fake_completion):
+        connector = LLMConnector(model="gpt-4", temperature=0.0)
+
+        connector.query("x")
+        connector.cache_clear()
+        connector.query("x")
+
+        assert len(fake_completion) == 2
+
+    def test_aquery_shares_cache_with_query(self, fake_completion):
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            connector = LLMConnector(model="gpt-4", temperature=0.0)
+
+            connector.query("x")
+
+            assert asyncio.run(connector.aquery("x")) == ["Final Answer: e4"]
+            mock_acompletion.assert_not_called()
+
+
+def stream_chunk(text):
+    """Build a streamed completion chunk carrying one piece of text."""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(delta=SimpleNamespace(content=text))]
+    )
+
+
+# Reasoning, the answer line, then 44 chunks of explanation nobody reads
+VERBOSE_STREAM_TEXTS = ["I think ", "about it.\n", "Final Answer: ", "e4", "\n"] + [
+    "because it controls the center. "
+] * 45
+
+
+class RecordingStream:
+    """Chunk iterator that records how far it was read and whether it closed."""
+
+    def __init__(self, texts):
+        self.texts = texts
+        self.chunks_read = 0
+        self.closed = False
+
+    def __iter__(self):
+        for text in self.texts:
+            self.chunks_read += 1
+            yield stream_chunk(text)
+
+    def __aiter__(self):
+        return self._async_chunks()
+
+    async def _async_chunks(self):
+        for chunk in self:
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+    async def aclose(self):
+        self.closed = True
+
+
+class TestLLMConnectorEarlyStop:
+    def test_query_stops_reading_stream_after_final_answer_line(self):
+        stream = RecordingStream(VERBOSE_STREAM_TEXTS)
+        with patch("litellm.completion", return_value=stream) as mock_completion:
+            connector = LLMConnector(model="gpt-4", early_stop=True)
+
+            response = connector.query("Your move?")
+
+        assert response == ["I think about it.\nFinal Answer: e4\n"]
+        assert mock_completion.call_args.kwargs["stream"] is True
+        assert stream.chunks_read == 5
+        assert stream.closed
+
+    def test_query_reads_whole_stream_without_final_answer(self):
+        stream = RecordingStream(["Let me ", "think about it."])
+        with patch("litellm.completion", return_value=stream):
+            connector = LLMConnector(model="gpt-4", early_stop=True)
+
+            assert connector.query("Your move?") == ["Let me think about it."]
+
+        assert stream.closed
+
+    def test_query_keeps_reading_past_final_answer_mentioned_in_reasoning(self):
+        stream = RecordingStream(
+            [
+                "Let me reason before my final answer: the center matters.\n",
+                "Nf3 is solid.\n",
+                "Final Answer: e4\n",
+                "It also frees the bishop.",
+            ]
+        )
+        with patch("litellm.completion", return_value=stream):
+            connector = LLMConnector(model="gpt-4", early_stop=True)
+
+            response = connector.query("Your move?")
+
+        assert response == [
+            "Let me reason before my final answer: the center matters.\n"
+            "Nf3 is solid.\nFinal Answer: e4\n"
+        ]
+        assert stream.chunks_read == 3
+        decision = GameArenaLLMMoveHandler().parse_decision_from_response(response[0])
+        assert decision.attempted_move == "e4"
+
+    def test_aquery_stops_reading_stream_after_final_answer_line(self):
+        stream = RecordingStream(VERBOSE_STREAM_TEXTS)
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = stream
+            connector = LLMConnector(model="gpt-4", early_stop=True)
+
+            response = asyncio.run(connector.aquery("Your move?"))
+
+        assert response == ["I think about it.\nFinal Answer: e4\n"]
+        assert stream.chunks_read == 5
+        assert stream.closed
+
+    def test_query_does_not_stream_by_default_or_for_multiple_samples(
+        self, fake_completion
+    ):
+        LLMConnector(model="gpt-4").query("Your move?")
+        LLMConnector(model="gpt-4", early_stop=True).query("Your move?", n=2)
+
+        assert all("stream" not in call_kwargs for call_kwargs in fake_completion)
+
+    def test_close_stream_closes_provider_stream_behind_litellm_wrapper(self):
+        provider_stream = Mock()
+        wrapper = SimpleNamespace(completion_stream=provider_stream)
+
+        LLMConnector._close_stream(wrapper)
+
+        provider_stream.close.assert_called_once()
+
+
+class TestLLMConnectorQueryInExecutor:
+    def test_query_in_executor_resolves_to_completion_contents(self, fake_completion):
+        connector = LLMConnector(model="gpt-4")
+
+        async def run_concurrent_queries():
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                return await asyncio.gather(
+                    connector.query_in_executor(loop, executor, "Move 1"),
+                    connector.query_in_executor(loop, executor, "Move 2", n=2),
+                )
+
+        results = asyncio.run(run_concurrent_queries())
+
+        assert results == [["Final Answer: e4"], ["Final Answer: e4"]]
+        assert len(fake_completion) == 2
+        n_values = sorted(call_kwargs["n"] for call_kwargs in fake_completion)
+        assert n_values == [1, 2]
+
+
+class TestLLMConnectorAsyncQuery:
+    def test_aquery_returns_contents_and_forwards_parameters(self):
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = Mock(
+                choices=[Mock(message=Mock(content="Final Answer: e4"))]
+            )
+            connector = LLMConnector(model="gpt-4", temperature=0.2, max_tokens=50)
+
+            response = asyncio.run(
+                connector.aquery("Your move?", n=2, system_prompt="Play chess")
+            )
+
+            assert response == ["Final Answer: e4"]
+            call_kwargs = mock_acompletion.call_args.kwargs
+            assert call_kwargs["model"] == "gpt-4"
+            assert call_kwargs["temperature"] == 0.2
+            assert call_kwargs["max_tokens"] == 50
+            assert call_kwargs["n"] == 2
+            assert call_kwargs["max_retries"] == 0
+            assert call_kwargs["messages"] == [
+                {"role": "system", "content": "Play chess"},
+                {"role": "user", "content": "Your move?"},
+            ]
+
+    def test_gathered_aqueries_are_in_flight_together(self):
+        num_queries = 10
+
+        async def run_concurrent_queries():
+            in_flight = 0
+            all_in_flight = asyncio.Event()
+
+            async def fake_acompletion(**kwargs):
+                nonlocal in_flight
+                in_flight += 1
+                if in_flight == num_queries:
+                    all_in_flight.set()
+                # Serial awaiting would never reach num_queries and time out
+                await asyncio.wait_for(all_in_flight.wait(), timeout=1.0)
+                content = kwargs["messages"][-1]["content"]
+                return Mock(choices=[Mock(message=Mock(content=content))])
+
+            with patch("litellm.acompletion", side_effect=fake_acompletion):
+                connector = LLMConnector(model="gpt-4")
+                return await asyncio.gather(
+                    *(connector.aquery(f"Move {i}") for i in range(num_queries))
+                )
+
+        results = asyncio.run(run_concurrent_queries())
+
+        assert results == [[f"Move {i}"] for i in range(num_queries)]
+
+    def test_aquery_retries_transient_errors_with_async_backoff(
+        self, async_backoff_sleep
+    ):
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.side_effect = [
+                litellm.RateLimitError(
+                    message="Too many requests", model="gpt-4", llm_provider="openai"
+                ),
+                Mock(choices=[Mock(message=Mock(content="Final Answer: e4"))]),
+            ]
+            connector = LLMConnector(model="gpt-4", max_retries=3)
+
+            assert asyncio.run(connector.aquery("Test")) == ["Final Answer: e4"]
+            assert mock_acompletion.call_count == 2
+            assert async_backoff_sleep.await_count == 1
+            assert 1.0 <= async_backoff_sleep.call_args.args[0] <= 2.0
+
+    def test_aquery_wraps_permanent_errors_without_retrying(self, async_backoff_sleep):
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.side_effect = litellm.AuthenticationError(
+                message="Bad key", model="gpt-4", llm_provider="openai"
+            )
+            connector = LLMConnector(model="gpt-4", max_retries=3)
+
+            with pytest.raises(ConnectionError, match="LLM API request invalid"):
+                asyncio.run(connector.aquery("Test"))
+
+            assert mock_acompletion.call_count == 1
+            async_backoff_sleep.assert_not_awaited()
+
+
+class TestLLMConnectorBatchQueryModels:
+    def test_batch_query_models_returns_completions_keyed_by_model(self):
+        def fake_completion(**kwargs):
+            content = f"{kwargs['model']}: Final Answer: e4"
+            return Mock(choices=[Mock(message=Mock(content=content))])
+
+        with patch("litellm.completion") as mock_completion:
+            mock_completion.side_effect = fake_completion
+            results = LLMConnector.batch_query_models(
+                ["gpt-4", "claude-3-haiku"], "Your move?", max_tokens=10
+            )
+
+        assert results == {
+            "gpt-4": ["gpt-4: Final Answer: e4"],
+            "claude-3-haiku": ["claude-3-haiku: Final Answer: e4"],
+        }
+        assert all(c.kwargs["max_tokens"] == 10 for c in mock_completion.call_args_list)
+
+    def test_batch_query_models_queries_duplicate_models_once(self):
+        def fake_completion(**kwargs):
+            return Mock(choices=[Mock(message=Mock(content=kwargs["model"]))])
+
+        with patch("litellm.completion") as mock_completion:
+            mock_completion.side_effect = fake_completion
+            results = LLMConnector.batch_query_models(
+                ["gpt-4", "claude-3-haiku", "gpt-4"], "Your move?"
+            )
+
+        assert list(results) == ["gpt-4", "claude-3-haiku"]
+        assert results == {"gpt-4": ["gpt-4"], "claude-3-haiku": ["claude-3-haiku"]}
+        assert mock_completion.call_count == 2
+
+    def test_batch_query_models_sends_all_requests_before_waiting(self):
+        models = ["gpt-4", "claude-3-haiku", "gemini/gemini-2.0-flash-exp"]
+        # Sequential dispatch would leave the first request waiting here alone
+        all_requests_sent = threading.Barrier(len(models), timeout=1.0)
+
+        def fake_completion(**kwargs):
+            all_requests_sent.wait()
+            return Mock(choices=[Mock(message=Mock(content=kwargs["model"]))])
+
+        with patch("litellm.completion", side_effect=fake_completion):
+            results = LLMConnector.batch_query_models(models, "Your move?")
+
+        assert results == {model: [model] for model in models}
+
+    def test_batch_query_models_raises_failure_after_other_models_finish(self):
+        def fake_completion(**kwargs):
+            if kwargs["model"] == "gpt-4":
+                raise litellm.AuthenticationError(
+                    message="Bad key", model="gpt-4", llm_provider="openai"
+                )
+            return Mock(choices=[Mock(message=Mock(content="Final Answer: e4"))])
+
+        with patch("litellm.completion") as mock_completion:
+            mock_completion.side_effect = fake_completion
+            with pytest.raises(ConnectionError, match="LLM API request invalid"):
+                LLMConnector.batch_query_models(
+                    ["gpt-4", "claude-3-haiku"], "Your move?"
+                )
+
+        assert mock_completion.call_count == 2
+
+
+class TestLLMConnectorErrorClassification:
+    def test_query_wraps_rate_limit_error_as_temporarily_unavailable(
+        self, backoff_sleep
+    ):
+        with patch("litellm.completion") as mock_completion:
+            mock_completion.side_effect = litellm.RateLimitError(
+                message="Too many requests", model="gpt-4", llm_provider="openai"
+            )
+
+            connector = LLMConnector(model="gpt-4")
+
+            with pytest.raises(ConnectionError, match="temporarily unavailable"):
+                connector.query("Test prompt")
+
+    def test_query_wraps_authentication_error_as_invalid_request(self):
+        with patch("litellm.completion") as mock_completion:
+            mock_completion.side_effect = litellm.AuthenticationError(
+                message="Bad key", model="gpt-4", llm_provider="openai"
+            )
+
+            connector = LLMConnector(model="gpt-4")
+
+            with pytest.raises(ConnectionError, match="LLM API request invalid"):
+                connector.query("Test prompt")
+
+    def test_transient_provider_errors_are_retryable(self):
+        assert is_retryable_error(
+            litellm.Timeout(message="slow", model="gpt-4", llm_provider="openai")
+        )
+        assert is_retryable_error(
+            litellm.RateLimitError(message="429", model="gpt-4", llm_provider="openai")
+        )
+        assert is_retryable_error(
+            litellm.APIConnectionError(
+                message="DNS failure", model="gpt-4", llm_provider="openai"
+            )
+        )
+
+    def test_permanent_and_unknown_errors_are_not_retryable(self):
+        assert not is_retryable_error(
+            litellm.AuthenticationError(
+                message="Bad key", model="gpt-4", llm_provider="openai"
+            )
+        )
+        assert not is_retryable_error(Exception("Unknown"))
+
+
 class TestLLMConnectorRetryLogic:
-    def test_query_passes_retry_configuration_to_litellm(self):
+    def test_query_retries_transient_errors_with_exponential_backoff(
+        self, backoff_sleep
+    ):
         with patch("litellm.completion") as mock_completion:
-            mock_completion.return_value = Mock(
-                choices=[Mock(message=Mock(content="Success"))]
+            rate_limit_error = litellm.RateLimitError(
+                message="Too many requests", model="gpt-4", llm_provider="openai"
             )
+            mock_completion.side_effect = [
+                rate_limit_error,
+                rate_limit_error,
+                Mock(choices=[Mock(message=Mock(content="Final Answer: e4"))]),
+            ]
 
-            connector = LLMConnector(
-                model="gpt-3.5-turbo",
-                max_retries=5,
+            connector = LLMConnector(model="gpt-4", max_retries=3)
+
+            assert connector.query("Test") == ["Final Answer: e4"]
+            assert mock_completion.call_count == 3
+            sleeps = [c.args[0] for c in backoff_sleep.call_args_list]
+            assert len(sleeps) == 2
+            assert 1.0 <= sleeps[0] <= 2.0
+            assert 2.0 <= sleeps[1] <= 3.0
+
+    def test_query_retries_connection_errors(self, backoff_sleep):
+        with patch("litellm.completion") as mock_completion:
+            mock_completion.side_effect = [
+                litellm.APIConnectionError(
+                    message="Connection reset by peer",
+                    model="gpt-4",
+                    llm_provider="openai",
+                ),
+                Mock(choices=[Mock(message=Mock(content="Final Answer: e4"))]),
+            ]
+
+            connector = LLMConnector(model="gpt-4", max_retries=3)
+
+            assert connector.query("Test") == ["Final Answer: e4"]
+            assert mock_completion.call_count == 2
+            assert backoff_sleep.call_count == 1
+
+    def test_query_gives_up_after_max_retries_on_transient_errors(self, backoff_sleep):
+        with patch("litellm.completion") as mock_completion:
+            mock_completion.side_effect = litellm.ServiceUnavailableError(
+                message="Overloaded", model="gpt-4", llm_provider="openai"
             )
 
-            response = connector.query("Test")
+            connector = LLMConnector(model="gpt-4", max_retries=2)
 
-            assert response == ["Success"]
-            assert mock_completion.call_count >= 1
+            with pytest.raises(ConnectionError, match="temporarily unavailable"):
+                connector.query("Test")
+
+            assert mock_completion.call_count == 3
+            assert backoff_sleep.call_count == 2
+
+    def test_query_does_not_retry_permanent_errors(self, backoff_sleep):
+        with patch("litellm.completion") as mock_completion:
+            mock_completion.side_effect = litellm.AuthenticationError(
+                message="Bad key", model="gpt-4", llm_provider="openai"
+            )
+
+            connector = LLMConnector(model="gpt-4", max_retries=3)
+
+            with pytest.raises(ConnectionError, match="LLM API request invalid"):
+                connector.query("Test")
+
+            assert mock_completion.call_count == 1
+            backoff_sleep.assert_not_called()
+
+    def test_query_disables_litellm_internal_retries(self, fake_completion):
+        LLMConnector(model="gpt-4", max_retries=5).query("Test")
+
+        assert fake_completion[-1]["max_retries"] == 0
+
+    def test_query_passes_retry_configuration_to_litellm(self, fake_completion):
+        connector = LLMConnector(
+            model="gpt-3.5-turbo",
+            max_retries=5,
+        )
+
+        response = connector.query("Test")
+
+        assert response == ["Final Answer: e4"]
+        assert len(fake_completion) >= 1
 
     def test_query_raises_error_after_all_retry_attempts_exhausted(self):
         with patch("litellm.completion") as mock_completion:
@@ -120,14 +712,30 @@ class TestLLMConnectorConfiguration:
         assert litellm.drop_params
         assert not litellm.set_verbose
 
-    @patch("litellm.completion")
-    def test_all_initialization_parameters_forwarded_to_litellm_completion(
-        self, mock_completion
+    def test_connectors_share_one_http_client_registered_with_litellm(
+        self, isolated_http_client
     ):
-        mock_completion.return_value = Mock(
-            choices=[Mock(message=Mock(content="Test"))]
-        )
+        first_connector = LLMConnector(model="gpt-4")
+        second_connector = LLMConnector(model="claude-3-haiku")
+
+        shared_client = first_connector._get_shared_http_client()
+
+        assert second_connector._get_shared_http_client() is shared_client
+        assert litellm.client_session is shared_client
 
+    def test_shared_http_client_keeps_existing_litellm_session(
+        self, isolated_http_client, monkeypatch
+    ):
+        caller_session = Mock()
+        monkeypatch.setattr(litellm, "client_session", caller_session)
+
+        LLMConnector(model="gpt-4")
+
+        assert litellm.client_session is caller_session
+
+    def test_all_initialization_parameters_forwarded_to_litellm_completion(
+        self, fake_completion
+    ):
         connector = LLMConnector(
             model="gpt-4",
             temperature=0.5,
@@ -138,77 +746,47 @@ class TestLLMConnectorConfiguration:
 
         connector.query("Test prompt")
 
-        call_kwargs = mock_completion.call_args.kwargs
+        call_kwargs = fake_completion[-1]
         assert call_kwargs["model"] == "gpt-4"
         assert call_kwargs["temperature"] == 0.5
         assert call_kwargs["max_tokens"] == 100
         assert call_kwargs["timeout"] == 20.0
 
 
-@pytest.mark.live
-class TestLLMConnectorRealAPI:
-    @pytest.mark.skipif(
-        not os.getenv("OPENAI_API_KEY"), reason="OpenAI API key not set"
-    )
-    def test_openai_api_connection_returns_valid_response(self):
-        openai_connector = LLMConnector(
-            model="gpt-3.5-turbo",
-            temperature=0.0,
-            max_tokens=10,
-            timeout=10.0,
-        )
-
-        llm_response = openai_connector.query(
-            "Say 'connection successful' in 3 words or less"
-        )
+# Cheap model per provider, with the environment variable holding its API key
+LIVE_PROVIDER_MODELS = [
+    ("gpt-3.5-turbo", "OPENAI_API_KEY"),
+    ("claude-3-haiku-20240307", "ANTHROPIC_API_KEY"),
+    ("gemini/gemini-2.0-flash-exp", "GOOGLE_API_KEY"),
+]
 
-        assert llm_response is not None
-        assert len(llm_response) > 0
-        assert isinstance(llm_response, list)
-        assert isinstance(llm_response[0], str)
-        print(f"OpenAI response: {llm_response[0]}")
 
-    @pytest.mark.skipif(
-        not os.getenv("ANTHROPIC_API_KEY"), reason="Anthropic API key not set"
-    )
-    def test_anthropic_api_connection_returns_valid_response(self):
-        anthropic_connector = LLMConnector(
-            model="claude-3-haiku-20240307",
-            temperature=0.0,
-            max_tokens=10,
-            timeout=10.0,
-        )
-
-        llm_response = anthropic_connector.query(
-            "Say 'connection successful' in 3 words or less"
-        )
-
-        assert llm_response is not None
-        assert len(llm_response) > 0
-        assert isinstance(llm_response, list)
-        assert isinstance(llm_response[0], str)
-        print(f"Anthropic response: {llm_response[0]}")
+@pytest.mark.live
+@pytest.mark.usefixtures("live_env")
+class TestLLMConnectorRealAPI:
+    def test_all_providers_respond_concurrently(self):
+        available_models = [
+            model
+            for model, api_key_env in LIVE_PROVIDER_MODELS
+            if os.getenv(api_key_env)
+        ]
+        if not available_models:
+            pytest.skip("No API keys available")
 
-    @pytest.mark.skipif(
-        not os.getenv("GOOGLE_API_KEY"), reason="Google API key not set"
-    )
-    def test_google_gemini_api_connection_returns_valid_response(self):
-        gemini_connector = LLMConnector(
-            model="gemini/gemini-2.0-flash-exp",
+        llm_responses = LLMConnector.batch_query_models(
+            available_models,
+            "Say 'connection successful' in 3 words or less",
             temperature=0.0,
             max_tokens=10,
             timeout=10.0,
         )
 
-        llm_response = gemini_connector.query(
-            "Say 'connection successful' in 3 words or less"
-        )
-
-        assert llm_response is not None
-        assert len(llm_response) > 0
-        assert isinstance(llm_response, list)
-        assert isinstance(llm_response[0], str)
-        print(f"Google response: {llm_response[0]}")
+        assert list(llm_responses) == available_models
+        for model, llm_response in llm_responses.items():
+            assert isinstance(llm_response, list)
+            assert len(llm_response) > 0
+            assert isinstance(llm_response[0], str)
+            print(f"{model} response: {llm_response[0]}")
 
     def test_llm_generates_valid_chess_opening_move(self):
         if os.getenv("OPENAI_API_KEY"):
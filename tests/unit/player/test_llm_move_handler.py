@@ -1,7 +1,9 @@
 import chess
 import pytest
 
+from llm_chess_arena.exceptions import ParseMoveError
 from llm_chess_arena.player.llm.llm_move_handler import (
+    GAME_ARENA_PROMPT_TEMPLATE,
     BaseLLMMoveHandler,
     GameArenaLLMMoveHandler,
 )
@@ -99,6 +101,53 @@ class TestGameArenaPromptGeneration:
         with pytest.raises(KeyError, match="player_color"):
             move_handler.get_prompt()
 
+    @pytest.mark.parametrize(
+        "template",
+        [
+            GAME_ARENA_PROMPT_TEMPLATE,
+            "Escaped {{braces}} around {player_color}",
+            "{player_color!r:>10} uses conversion and format spec",
+            "Indexed {move_history_in_uci[0]}",
+        ],
+    )
+    def test_prompt_matches_str_format_for_preparsed_and_fallback_templates(
+        self, template
+    ):
+        move_handler = GameArenaLLMMoveHandler()
+        move_handler.prompt_template = template
+        prompt_kwargs = {
+            "board_in_fen": chess.STARTING_FEN,
+            "player_color": "white",
+            "move_history_in_uci": ["e2e4", "e7e5"],
+        }
+
+        prompt = move_handler.get_prompt(**prompt_kwargs)
+
+        assert prompt == template.format(
+            flattened_move_history_in_uci=move_handler._flatten_move_history_in_uci(
+                prompt_kwargs["move_history_in_uci"]
+            ),
+            **prompt_kwargs,
+        )
+
+    def test_get_prompts_builds_one_prompt_per_context_in_order(self):
+        move_handler = GameArenaLLMMoveHandler()
+        boards = [chess.Board(), chess.Board()]
+        boards[1].push_uci("e2e4")
+        batch = [
+            {
+                "board_in_fen": board.fen(),
+                "player_color": "white" if board.turn else "black",
+                "move_history_in_uci": [move.uci() for move in board.move_stack],
+            }
+            for board in boards
+        ]
+
+        prompts = move_handler.get_prompts(batch)
+
+        assert prompts == [move_handler.get_prompt(**kwargs) for kwargs in batch]
+        assert boards[1].fen() in prompts[1]
+
 
 class TestMoveExtractionFromLLMResponse:
     @pytest.mark.parametrize(
@@ -125,6 +174,23 @@ class TestMoveExtractionFromLLMResponse:
         move_handler = GameArenaLLMMoveHandler()
         assert move_handler._extract_raw_move_text(response) == expected
 
+    def test_repeated_response_is_extracted_from_cache(self):
+        response = "Let me think. Final Answer: Nf3\nIt develops a piece."
+        GameArenaLLMMoveHandler._extract_raw_move_text.cache_clear()
+
+        first_decision = GameArenaLLMMoveHandler().parse_decision_from_response(
+            response
+        )
+        second_decision = GameArenaLLMMoveHandler().parse_decision_from_response(
+            response
+        )
+
+        assert first_decision.attempted_move == second_decision.attempted_move == "Nf3"
+        assert first_decision is not second_decision
+        cache_info = GameArenaLLMMoveHandler._extract_raw_move_text.cache_info()
+        assert cache_info.hits == 1
+        assert cache_info.misses == 1
+
 
 class TestMoveTextSanitization:
     @pytest.mark.parametrize(
@@ -213,8 +279,6 @@ class TestMoveParsingFromSanitizedText:
 
         response_without_marker = "I think e4 is the best move here"
 
-        from llm_chess_arena.exceptions import ParseMoveError
-
         with pytest.raises(ParseMoveError):
             move_handler.parse_decision_from_response(
                 response_without_marker, starting_board
@@ -271,7 +335,6 @@ class TestMoveParsingFromSanitizedText:
         move_handler = GameArenaLLMMoveHandler()
 
         incomplete_response = "I think e4"
-        from llm_chess_arena.exceptions import ParseMoveError
 
         with pytest.raises(ParseMoveError):
             move_handler.parse_decision_from_response(incomplete_response)
@@ -458,7 +521,6 @@ class TestEndToEndMoveHandlerWorkflow:
 
         # First attempt fails due to missing marker
         invalid_first_response = "I think e4 is best"
-        from llm_chess_arena.exceptions import ParseMoveError
 
         with pytest.raises(ParseMoveError):
             move_handler.parse_decision_from_response(invalid_first_response)
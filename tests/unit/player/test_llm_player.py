@@ -6,6 +6,7 @@ from llm_chess_arena.player.llm import (
     LLMPlayer,
     GameArenaLLMMoveHandler,
 )
+from llm_chess_arena.types import PlayerDecision
 from tests.fixtures.mock_llm_connector import MockLLMConnector
 
 
@@ -126,6 +127,27 @@ class TestLLMPlayerRetryLogic:
         # Verify retry attempts: initial + 2 retries = 3 queries
         assert failing_connector.query_count == 3
 
+    def test_player_returns_llm_resignation_immediately_without_retrying(self):
+        resigning_connector = MockLLMConnector(responses=["I resign"])
+        resigning_handler = Mock(spec=GameArenaLLMMoveHandler)
+        resigning_handler.get_prompt.return_value = "prompt"
+        resigning_handler.parse_decision_from_response.return_value = PlayerDecision(
+            action="resign"
+        )
+
+        resigning_player = LLMPlayer(
+            connector=resigning_connector,
+            handler=resigning_handler,
+            color="white",
+            max_move_retries=3,
+        )
+
+        resignation_decision = resigning_player(chess.Board())
+
+        assert resignation_decision.action == "resign"
+        assert resigning_connector.query_count == 1
+        resigning_handler.get_retry_prompt.assert_not_called()
+
     def test_player_successfully_recovers_on_second_attempt_after_initial_invalid_move(
         self,
     ):
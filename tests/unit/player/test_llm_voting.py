@@ -2,7 +2,7 @@
 
 import chess
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from llm_chess_arena.player.llm import LLMPlayer, GameArenaLLMMoveHandler
 from tests.fixtures.mock_llm_connector import MockLLMConnector
@@ -67,6 +67,32 @@ class TestLLMVotingEdgeCases:
         # e4 and d4 both have 2 votes, e4 appeared first so should win
         assert decision.attempted_move == "e2e4"
 
+    def test_voting_tie_favors_first_voted_move_not_first_to_reach_count(self):
+        """Test that ties go to the move voted for first, even if it caught up later."""
+        connector = MockLLMConnector(
+            model="test-model",
+            responses=[
+                "Final Answer: d4",
+                "Final Answer: e4",
+                "Final Answer: e4",
+                "Final Answer: d4",
+            ],
+        )
+        handler = GameArenaLLMMoveHandler()
+        player = LLMPlayer(
+            connector=connector,
+            handler=handler,
+            color="white",
+            num_votes=4,
+            max_move_retries=1,
+        )
+
+        board = chess.Board()
+        decision = player(board)
+
+        # e4 reached 2 votes first, but d4 was voted for first
+        assert decision.attempted_move == "d2d4"
+
     def test_voting_with_mixed_valid_invalid(self):
         """Test voting with mix of valid and invalid responses."""
         connector = MockLLMConnector(
@@ -338,8 +364,7 @@ class TestVotingPerformance:
     """Test voting performance characteristics."""
 
     def test_voting_stops_early_on_majority(self):
-        """Test that voting could optimize by stopping early (future enhancement)."""
-        # This test documents current behavior - all samples are always collected
+        """Test that tallying stops once the remaining votes cannot flip the winner."""
         connector = MockLLMConnector(
             model="test-model",
             responses=[
@@ -360,11 +385,44 @@ class TestVotingPerformance:
         )
 
         board = chess.Board()
-        decision = player(board)
+        with patch.object(
+            handler,
+            "parse_decision_from_response",
+            wraps=handler.parse_decision_from_response,
+        ) as parse_spy:
+            decision = player(board)
 
         assert decision.attempted_move == "e2e4"
-        # Currently collects all 5 samples in one query call
+        # All 5 samples still arrive in one query call
         assert connector.query_count == 1
+        # 3 of 5 identical votes lock the majority, remaining 2 are skipped
+        assert parse_spy.call_count == 3
+
+    def test_voting_does_not_stop_early_when_runner_up_can_still_tie(self):
+        """Test that a lead equal to the outstanding votes keeps tallying."""
+        connector = MockLLMConnector(
+            model="test-model",
+            responses=[
+                "Final Answer: e4",
+                "Final Answer: e4",
+                "Final Answer: d4",
+                "Final Answer: d4",
+                "Final Answer: d4",
+            ],
+        )
+        handler = GameArenaLLMMoveHandler()
+        player = LLMPlayer(
+            connector=connector,
+            handler=handler,
+            color="white",
+            num_votes=5,
+            max_move_retries=1,
+        )
+
+        board = chess.Board()
+        decision = player(board)
+
+        assert decision.attempted_move == "d2d4"
 
     def test_voting_with_many_samples(self):
         """Test voting with large number of samples."""
@@ -0,0 +1,125 @@
+import sys
+import textwrap
+
+import chess
+import chess.engine
+import pytest
+
+from llm_chess_arena.player.raw_uci_engine import RawUCIEngine
+
+# Minimal UCI engine that records commands and always plays the first legal move
+FAKE_UCI_ENGINE_SOURCE = textwrap.dedent(
+    """
+    import sys
+    import chess
+
+    board = chess.Board()
+    log = open(sys.argv[1], "a")
+    for line in sys.stdin:
+        log.write(line)
+        log.flush()
+        command = line.split()
+        if not command:
+            continue
+        if command[0] == "uci":
+            print("id name Fake", flush=True)
+            print("uciok", flush=True)
+        elif command[0] == "isready":
+            print("readyok", flush=True)
+        elif command[0] == "position":
+            board = chess.Board(" ".join(command[2:]))
+        elif command[0] == "go":
+            move = next(iter(board.legal_moves), None)
+            print("info depth 1 score cp 0", flush=True)
+            print(f"bestmove {move.uci() if move else '(none)'}", flush=True)
+        elif command[0] == "quit":
+            break
+    """
+)
+
+
+@pytest.fixture
+def fake_engine_binary(tmp_path):
+    script = tmp_path / "fake_engine.py"
+    script.write_text(FAKE_UCI_ENGINE_SOURCE)
+    command_log = tmp_path / "commands.log"
+    binary = tmp_path / "fake_engine"
+    binary.write_text(f"#!/bin/sh\nexec {sys.executable} {script} {command_log}\n")
+    binary.chmod(0o755)
+    return str(binary), command_log
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses a POSIX shell wrapper")
+class TestRawUCIEngine:
+    def test_play__returns_best_move_for_position(self, fake_engine_binary):
+        binary_path, _ = fake_engine_binary
+        engine = RawUCIEngine.popen(binary_path)
+        board = chess.Board("8/8/8/4k3/8/3QK3/8/8 w - - 0 1")
+
+        best_move = engine.play(board.fen(), {"depth": 3})
+
+        assert chess.Move.from_uci(best_move) in board.legal_moves
+        engine.quit()
+
+    def test_play__sends_search_limits_as_go_arguments(self, fake_engine_binary):
+        binary_path, command_log = fake_engine_binary
+        engine = RawUCIEngine.popen(binary_path)
+
+        engine.configure({"Threads": 1, "UCI_LimitStrength": True})
+        engine.play(chess.Board().fen(), {"depth": 5, "time": 0.25})
+        engine.quit()
+
+        commands = command_log.read_text().splitlines()
+        assert "setoption name Threads value 1" in commands
+        assert "setoption name UCI_LimitStrength value true" in commands
+        assert "go depth 5 movetime 250" in commands
+
+    def test_play__sends_clock_limits_as_go_arguments(self, fake_engine_binary):
+        binary_path, command_log = fake_engine_binary
+        engine = RawUCIEngine.popen(binary_path)
+
+        engine.play(
+            chess.Board().fen(),
+            {
+                "white_clock": 60,
+                "black_clock": 59.5,
+                "white_inc": 1,
+                "black_inc": 1,
+                "remaining_moves": 40,
+            },
+        )
+        engine.quit()
+
+        expected_go = "go wtime 60000 btime 59500 winc 1000 binc 1000 movestogo 40"
+        assert expected_go in command_log.read_text().splitlines()
+
+    def test_play__rejects_limits_that_do_not_bound_the_search(
+        self, fake_engine_binary
+    ):
+        binary_path, command_log = fake_engine_binary
+        engine = RawUCIEngine.popen(binary_path)
+
+        with pytest.raises(ValueError, match="do not bound"):
+            engine.play(chess.Board().fen(), {})
+        engine.quit()
+
+        assert not any(
+            command.startswith("go") for command in command_log.read_text().splitlines()
+        )
+
+    def test_play__raises_engine_error_when_no_move_available(self, fake_engine_binary):
+        binary_path, _ = fake_engine_binary
+        engine = RawUCIEngine.popen(binary_path)
+        checkmated = "rnb1kbnr/pppp1ppp/8/4p3/6Pq/5P2/PPPPP2P/RNBQKBNR w KQkq - 1 3"
+
+        with pytest.raises(chess.engine.EngineError):
+            engine.play(checkmated, {"depth": 1})
+        engine.quit()
+
+    def test_play__raises_terminated_error_after_engine_exits(self, fake_engine_binary):
+        binary_path, _ = fake_engine_binary
+        engine = RawUCIEngine.popen(binary_path)
+        engine.quit()
+
+        with pytest.raises(chess.engine.EngineTerminatedError):
+            engine.play(chess.Board().fen(), {"depth": 1})
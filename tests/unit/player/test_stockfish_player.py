@@ -1,11 +1,19 @@
 import os
 import shutil
+from unittest.mock import Mock, patch
 
 import chess
+import chess.engine
 import pytest
 
 from llm_chess_arena.game import Game
-from llm_chess_arena.player.stockfish_player import StockfishPlayer
+from llm_chess_arena.player.stockfish_player import (
+    StockfishPlayer,
+    reset_binary_cache,
+)
+from llm_chess_arena.player.stockfish_pool import StockfishEnginePool
+from llm_chess_arena.types import PlayerDecisionContext
+from llm_chess_arena.utils import get_legal_moves_in_uci
 
 
 def stockfish_available():
@@ -84,6 +92,131 @@ class TestStockfishPlayer:
 
         player.close()
 
+    def test_raw_uci_mode__plays_legal_moves_without_pooled_engine(self):
+        player = StockfishPlayer(
+            name="Raw Stockfish",
+            color="white",
+            engine_limits={"depth": 5},
+            use_raw_uci=True,
+        )
+
+        board = chess.Board()
+        decision = player(board)
+
+        assert chess.Move.from_uci(decision.attempted_move) in board.legal_moves
+        assert player.engine is None
+        assert player.raw_engine is not None
+        player.close()
+        assert player.raw_engine is None
+
+    def test_decide_batch__returns_legal_moves_in_submission_order(self):
+        player = StockfishPlayer(
+            name="Batch Stockfish", color="white", engine_limits={"depth": 3}
+        )
+        boards = [
+            chess.Board(),
+            chess.Board("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1"),
+            chess.Board("8/8/8/4k3/8/3QK3/8/8 w - - 0 1"),
+        ]
+        contexts = [
+            PlayerDecisionContext(
+                board_in_fen=board.fen(),
+                player_color="white",
+                legal_moves_in_uci=get_legal_moves_in_uci(board),
+            )
+            for board in boards
+        ]
+
+        decisions = player.decide_batch(contexts, max_workers=2)
+
+        assert len(decisions) == len(boards)
+        for board, decision in zip(boards, decisions):
+            assert chess.Move.from_uci(decision.attempted_move) in board.legal_moves
+        player.close()
+
+
+class TestStockfishDecideBatch:
+    def test_decide_batch__uses_single_threaded_engines_and_preserves_order(self):
+        spawned_engines = []
+
+        def spawn_first_legal_move_engine(*args, **kwargs):
+            engine = Mock(spec=chess.engine.SimpleEngine)
+            engine.play.side_effect = lambda board, limit, **kw: (
+                chess.engine.PlayResult(next(iter(board.legal_moves)), None)
+            )
+            spawned_engines.append(engine)
+            return engine
+
+        fens = [
+            chess.Board().fen(),
+            "8/8/8/4k3/8/3QK3/8/8 w - - 0 1",
+            "r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1",
+            "8/8/8/3k4/3K4/8/8/8 w - - 0 1",
+        ]
+        contexts = [
+            PlayerDecisionContext(
+                board_in_fen=fen,
+                player_color="white",
+                legal_moves_in_uci=get_legal_moves_in_uci(chess.Board(fen)),
+            )
+            for fen in fens
+        ]
+        with (
+            patch.object(StockfishPlayer, "_find_stockfish_binary", return_value="/sf"),
+            patch.object(
+                chess.engine.SimpleEngine,
+                "popen_uci",
+                side_effect=spawn_first_legal_move_engine,
+            ),
+        ):
+            player = StockfishPlayer(
+                color="white",
+                engine_options={"Hash": 16},
+                engine_pool=StockfishEnginePool(),
+            )
+            decisions = player.decide_batch(contexts, max_workers=3)
+
+        expected_moves = [
+            next(iter(chess.Board(fen).legal_moves)).uci() for fen in fens
+        ]
+        assert [d.attempted_move for d in decisions] == expected_moves
+        assert 1 <= len(spawned_engines) <= 3
+        for engine in spawned_engines:
+            engine.configure.assert_called_once_with({"Hash": 16, "Threads": 1})
+
+    def test_decide_batch__returns_empty_list_for_no_contexts(self):
+        with patch.object(
+            StockfishPlayer, "_find_stockfish_binary", return_value="/sf"
+        ):
+            player = StockfishPlayer(color="white", engine_pool=StockfishEnginePool())
+
+        assert player.decide_batch([]) == []
+
+
+class TestStockfishScratchBoard:
+    def test_make_decision__reloads_one_board_for_every_position(self):
+        searched_positions = []
+
+        def play_first_legal_move(board, limit, **kwargs):
+            searched_positions.append((id(board), board.fen()))
+            return chess.engine.PlayResult(next(iter(board.legal_moves)), None)
+
+        engine = Mock(spec=chess.engine.SimpleEngine)
+        engine.play.side_effect = play_first_legal_move
+        with (
+            patch.object(StockfishPlayer, "_find_stockfish_binary", return_value="/sf"),
+            patch.object(chess.engine.SimpleEngine, "popen_uci", return_value=engine),
+        ):
+            player = StockfishPlayer(color="white", engine_pool=StockfishEnginePool())
+            board = chess.Board()
+            player(board)
+            board.push_san("e4")
+            board.push_san("e5")
+            player(board)
+
+        assert searched_positions[0][0] == searched_positions[1][0]
+        assert searched_positions[1][1] == board.fen()
+
 
 class TestStockfishNotAvailable:
     def test_invalid_binary_path__raises_file_not_found_error_with_descriptive_message(
@@ -99,6 +232,33 @@ class TestStockfishNotAvailable:
 
         assert "Stockfish binary not found" in str(exc_info.value)
 
+    def test_non_executable_binary__raises_file_not_found_error(self, tmp_path):
+        binary = tmp_path / "stockfish"
+        binary.write_text("")
+        binary.chmod(0o644)
+
+        with pytest.raises(FileNotFoundError, match="not executable"):
+            StockfishPlayer._find_stockfish_binary(str(binary))
+
+    def test_directory_binary_path__rejected_as_not_executable(self, tmp_path):
+        with pytest.raises(FileNotFoundError, match="not executable"):
+            StockfishPlayer._find_stockfish_binary(str(tmp_path))
+
+    def test_binary_lookup__cached_until_reset(self, tmp_path):
+        binary = tmp_path / "stockfish"
+        binary.write_text("")
+        binary.chmod(0o755)
+        reset_binary_cache()
+
+        first_path = StockfishPlayer._find_stockfish_binary(str(binary))
+        binary.unlink()
+        cached_path = StockfishPlayer._find_stockfish_binary(str(binary))
+
+        assert cached_path == first_path
+        reset_binary_cache()
+        with pytest.raises(FileNotFoundError):
+            StockfishPlayer._find_stockfish_binary(str(binary))
+
     def test_various_engine_limits__stored_without_validation(self):
         player = StockfishPlayer(
             name="Test",
@@ -0,0 +1,136 @@
+from unittest.mock import Mock, patch
+
+import chess.engine
+import pytest
+
+from llm_chess_arena.player import stockfish_pool
+from llm_chess_arena.player.stockfish_pool import (
+    StockfishEnginePool,
+    get_default_engine_pool,
+)
+
+
+@pytest.fixture
+def mock_popen_uci():
+    with patch.object(
+        chess.engine.SimpleEngine,
+        "popen_uci",
+        side_effect=lambda *args, **kwargs: Mock(spec=chess.engine.SimpleEngine),
+    ) as popen_uci:
+        yield popen_uci
+
+
+class TestStockfishEnginePool:
+    def test_acquire__starts_and_configures_engine_when_pool_empty(
+        self, mock_popen_uci
+    ):
+        pool = StockfishEnginePool()
+
+        engine = pool.acquire("/bin/stockfish", {"Hash": 16})
+
+        mock_popen_uci.assert_called_once_with("/bin/stockfish")
+        engine.configure.assert_called_once_with({"Hash": 16})
+
+    def test_release_then_acquire__reuses_engine_without_respawning(
+        self, mock_popen_uci
+    ):
+        pool = StockfishEnginePool()
+
+        first_engine = pool.acquire("/bin/stockfish", {"Hash": 16})
+        pool.release(first_engine)
+        second_engine = pool.acquire("/bin/stockfish", {"Hash": 16})
+
+        assert second_engine is first_engine
+        assert mock_popen_uci.call_count == 1
+        first_engine.quit.assert_not_called()
+
+    def test_acquire__reconfigures_only_changed_options_on_reuse(self, mock_popen_uci):
+        pool = StockfishEnginePool()
+
+        weak_engine = pool.acquire("/bin/stockfish", {"Hash": 16, "Skill Level": 1})
+        pool.release(weak_engine)
+        strong_engine = pool.acquire("/bin/stockfish", {"Hash": 16, "Skill Level": 20})
+
+        assert strong_engine is weak_engine
+        assert mock_popen_uci.call_count == 1
+        strong_engine.configure.assert_called_with({"Skill Level": 20})
+
+    def test_acquire__skips_configure_when_options_unchanged(self, mock_popen_uci):
+        pool = StockfishEnginePool()
+
+        engine = pool.acquire("/bin/stockfish", {"Hash": 16})
+        pool.release(engine)
+        pool.acquire("/bin/stockfish", {"Hash": 16})
+
+        engine.configure.assert_called_once_with({"Hash": 16})
+
+    def test_acquire__resets_options_dropped_by_next_borrower(self, mock_popen_uci):
+        pool = StockfishEnginePool()
+
+        engine = pool.acquire("/bin/stockfish", {"Skill Level": 1})
+        engine.options = {"Skill Level": Mock(default=20)}
+        pool.release(engine)
+        pool.acquire("/bin/stockfish")
+
+        engine.configure.assert_called_with({"Skill Level": 20})
+
+    def test_release__quits_engine_that_fails_health_check(self, mock_popen_uci):
+        pool = StockfishEnginePool()
+
+        crashed_engine = pool.acquire("/bin/stockfish")
+        crashed_engine.ping.side_effect = chess.engine.EngineTerminatedError()
+        pool.release(crashed_engine)
+
+        crashed_engine.quit.assert_called_once()
+        assert pool.acquire("/bin/stockfish") is not crashed_engine
+
+    def test_release__quits_engines_beyond_idle_capacity(self, mock_popen_uci):
+        pool = StockfishEnginePool(max_idle_engines_per_key=1)
+
+        first_engine = pool.acquire("/bin/stockfish")
+        second_engine = pool.acquire("/bin/stockfish")
+        pool.release(first_engine)
+        pool.release(second_engine)
+
+        first_engine.quit.assert_not_called()
+        second_engine.quit.assert_called_once()
+
+    def test_prewarm__fills_idle_engines_up_to_capacity(self, mock_popen_uci):
+        pool = StockfishEnginePool(max_idle_engines_per_key=2)
+
+        pool.prewarm("/bin/stockfish", num_engines=5)
+        pool.acquire("/bin/stockfish")
+        pool.acquire("/bin/stockfish")
+
+        assert mock_popen_uci.call_count == 2
+
+    def test_close__quits_idle_engines(self, mock_popen_uci):
+        pool = StockfishEnginePool()
+
+        engine = pool.acquire("/bin/stockfish")
+        pool.release(engine)
+        pool.close()
+
+        engine.quit.assert_called_once()
+
+
+class TestDefaultEnginePool:
+    @pytest.fixture(autouse=True)
+    def no_default_pool(self, monkeypatch):
+        monkeypatch.setattr(stockfish_pool, "_default_engine_pool", None)
+
+    def test_get_default_engine_pool__registers_close_at_exit_once(self):
+        with patch("threading._register_atexit") as register_atexit:
+            pool = get_default_engine_pool()
+
+            assert get_default_engine_pool() is pool
+        register_atexit.assert_called_once_with(pool.close)
+
+    def test_get_default_engine_pool__survives_interpreter_shutdown(self):
+        with patch(
+            "threading._register_atexit",
+            side_effect=RuntimeError("can't register atexit after shutdown"),
+        ):
+            pool = get_default_engine_pool()
+
+        assert isinstance(pool, StockfishEnginePool)
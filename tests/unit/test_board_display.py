@@ -0,0 +1,147 @@
+import io
+import random
+from types import SimpleNamespace
+
+import chess
+import pytest
+
+from llm_chess_arena import board_display
+from llm_chess_arena.board_display import Colors
+
+
+@pytest.fixture
+def binary_stdout(monkeypatch):
+    """Point the display's stdout at a text stream that writes CRLF newlines."""
+    raw_output = io.BytesIO()
+    stream = io.TextIOWrapper(raw_output, encoding="utf-8", newline="\r\n")
+    monkeypatch.setattr(board_display, "sys", SimpleNamespace(stdout=stream))
+    return stream, raw_output
+
+
+class TestWriteLines:
+    def test_write_lines__writes_frame_to_binary_buffer_in_one_piece(
+        self, binary_stdout
+    ):
+        stream, raw_output = binary_stdout
+
+        stream.write("before ")
+        board_display._write_lines(["♔ first", "second"])
+
+        assert raw_output.getvalue() == "before ♔ first\nsecond\n".encode("utf-8")
+
+    def test_write_lines__keeps_text_newline_translation_on_windows(
+        self, binary_stdout, monkeypatch
+    ):
+        stream, raw_output = binary_stdout
+        monkeypatch.setattr(board_display, "os", SimpleNamespace(name="nt"))
+
+        board_display._write_lines(["first", "second"])
+        stream.flush()
+
+        assert raw_output.getvalue() == b"first\r\nsecond\r\n"
+
+    def test_write_lines__falls_back_to_text_write_without_buffer(self, monkeypatch):
+        captured = io.StringIO()
+        monkeypatch.setattr(board_display, "sys", SimpleNamespace(stdout=captured))
+
+        board_display._write_lines(["first", "second"])
+
+        assert captured.getvalue() == "first\nsecond\n"
+
+
+def render_rank_line_per_square(board, rank, flip, highlight_squares, last_move):
+    """Render one rank line square by square, as the display originally did."""
+    row = ""
+    for file in range(7, -1, -1) if flip else range(8):
+        square = chess.square(file, rank)
+        piece = board.piece_at(square)
+        bg_color = board_display.get_square_color(square)
+        if highlight_squares and square in highlight_squares:
+            bg_color = Colors.BG_GREEN
+        elif last_move and square in (last_move.from_square, last_move.to_square):
+            bg_color = Colors.BG_RED
+        row += (
+            f"{bg_color}{board_display.get_piece_color(piece)} "
+            f"{board_display.get_piece_display(piece)} {Colors.RESET}"
+        )
+    rank_label = f"{Colors.BOLD}{Colors.YELLOW}{rank + 1:>4} {Colors.RESET}"
+    return f"{rank_label}{row} {Colors.BOLD}{Colors.YELLOW}{rank + 1}{Colors.RESET}"
+
+
+def assert_ranks_render_per_square(
+    board, flip=False, highlight_squares=None, last_move=None
+):
+    lines = board_display._format_board_lines(
+        board, highlight_squares=highlight_squares, last_move=last_move, flip=flip
+    )
+    ranks = range(8) if flip else range(7, -1, -1)
+    expected_rank_lines = [
+        render_rank_line_per_square(board, rank, flip, highlight_squares, last_move)
+        for rank in ranks
+    ]
+    assert lines[4:12] == expected_rank_lines
+
+
+@pytest.fixture(autouse=True)
+def empty_rank_row_cache(monkeypatch):
+    monkeypatch.setattr(board_display, "_RANK_ROW_CACHE", {})
+
+
+class TestFormatBoardLines:
+    @pytest.mark.parametrize("seed", range(40))
+    def test_cached_rank_rows__match_per_square_rendering_over_random_game(self, seed):
+        rng = random.Random(seed)
+        board = chess.Board()
+        for _ in range(60):
+            if board.is_game_over():
+                break
+            board.push(rng.choice(list(board.legal_moves)))
+            highlight_squares = rng.sample(chess.SQUARES, 2)
+            for flip in (False, True):
+                assert_ranks_render_per_square(
+                    board,
+                    flip=flip,
+                    highlight_squares=highlight_squares,
+                    last_move=board.peek(),
+                )
+
+    def test_rank_row__rerendered_when_highlight_moves_within_rank(self):
+        board = chess.Board()
+
+        assert_ranks_render_per_square(board, highlight_squares=[chess.E4])
+        assert_ranks_render_per_square(board, highlight_squares=[chess.D4])
+        assert_ranks_render_per_square(board)
+
+    def test_flipped_board__cached_separately_from_unflipped(self):
+        board = chess.Board()
+        board.push_san("e4")
+
+        assert_ranks_render_per_square(board, flip=False, last_move=board.peek())
+        assert_ranks_render_per_square(board, flip=True, last_move=board.peek())
+        assert_ranks_render_per_square(board, flip=False, last_move=board.peek())
+
+    def test_rank_row_cache__cleared_once_max_size_reached(self, monkeypatch):
+        monkeypatch.setattr(board_display, "RANK_ROW_CACHE_MAX_SIZE", 8)
+        board = chess.Board()
+
+        board_display._format_board_lines(board)
+        assert len(board_display._RANK_ROW_CACHE) == 8
+
+        board.push_san("e4")
+        assert_ranks_render_per_square(board, last_move=board.peek())
+        assert len(board_display._RANK_ROW_CACHE) <= 8
+
+
+class TestVisibleLen:
+    def test_visible_len__skips_ansi_codes(self):
+        text = f"{Colors.BOLD}{Colors.RED}CHECK!{Colors.RESET}"
+
+        assert board_display._visible_len(text) == len("CHECK!")
+
+    def test_visible_len__skips_extended_color_codes(self):
+        text = f"{Colors.BG_DARK_BROWN} ♘ {Colors.RESET}"
+
+        assert board_display._visible_len(text) == 3
+
+    def test_visible_len__counts_plain_text(self):
+        assert board_display._visible_len("Move: 12") == len("Move: 12")
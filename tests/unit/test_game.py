@@ -3,7 +3,7 @@ import pytest
 
 from llm_chess_arena.game import Game
 from llm_chess_arena.exceptions import IllegalMoveError
-from tests.conftest import (
+from tests.helpers import (
     IllegalMovePlayer,
     ScriptedPlayer,
     assert_game_terminated,
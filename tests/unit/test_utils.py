@@ -14,6 +14,43 @@ from llm_chess_arena.exceptions import (
 
 
 class TestGetLegalMovesInUCI:
+    def test_transposed_position__reuses_cached_moves(self):
+        via_knights_first = chess.Board()
+        for uci_move in ("g1f3", "g8f6", "e2e4"):
+            via_knights_first.push_uci(uci_move)
+        via_pawn_first = chess.Board()
+        for uci_move in ("e2e4", "g8f6", "g1f3"):
+            via_pawn_first.push_uci(uci_move)
+
+        assert get_legal_moves_in_uci(via_pawn_first) == get_legal_moves_in_uci(
+            via_knights_first
+        )
+
+    def test_cached_moves__returned_as_independent_lists(self):
+        board = chess.Board()
+
+        first_moves = get_legal_moves_in_uci(board)
+        first_moves.clear()
+
+        assert len(get_legal_moves_in_uci(board)) == 20
+
+    def test_capturable_en_passant_square__cached_separately(self):
+        without_en_passant = chess.Board(
+            "rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq - 0 3"
+        )
+        with_en_passant = chess.Board(
+            "rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3"
+        )
+
+        assert "e5f6" not in get_legal_moves_in_uci(without_en_passant)
+        assert "e5f6" in get_legal_moves_in_uci(with_en_passant)
+
+    def test_chess960_castling__not_served_from_standard_cache(self):
+        fen = "r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1"
+
+        assert "e1g1" in get_legal_moves_in_uci(chess.Board(fen))
+        assert "e1h1" in get_legal_moves_in_uci(chess.Board(fen, chess960=True))
+
     def test_starting_position__returns_exactly_20_legal_moves(self):
         board = chess.Board()
         moves = get_legal_moves_in_uci(board)
@@ -217,3 +254,14 @@ class TestUtilsEdgeCases:
         board_from_original_fen = chess.Board(starting_position)
         moves = get_legal_moves_in_uci(board_from_original_fen)
         assert len(moves) == 20
+
+    def test_parse_attempted_move__caches_successful_parses_per_position(self):
+        starting_position = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+        parse_attempted_move_to_uci.cache_clear()
+
+        parse_attempted_move_to_uci("e4", starting_position)
+        parse_attempted_move_to_uci("e4", starting_position)
+
+        cache_info = parse_attempted_move_to_uci.cache_info()
+        assert cache_info.hits == 1
+        assert cache_info.misses == 1